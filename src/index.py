@@ -3,15 +3,22 @@ import sys
 import json
 import pygame
 import requests
+from requests.adapters import HTTPAdapter
 import traceback
 import re
+import shutil
+import subprocess
 from zipfile import ZipFile
 from io import BytesIO
 from datetime import datetime
 from urllib.parse import urljoin, unquote, quote
 import html
-from threading import Thread
-from queue import Queue
+from threading import Thread, Lock, local
+from queue import Queue, Empty
+from collections import OrderedDict
+from functools import lru_cache
+from operator import itemgetter
+from types import MappingProxyType
 
 # Check for development mode
 DEV_MODE = os.getenv('DEV_MODE', 'false').lower() == 'true'
@@ -35,6 +42,17 @@ FPS = 30
 SCREEN_WIDTH, SCREEN_HEIGHT = 800, 600
 FONT_SIZE = 28
 
+# Shared read-only default for dict.get lookups, avoids allocating a new {} per call
+EMPTY_MAPPING = MappingProxyType({})
+
+# Settings that do not depend on the environment, the directory defaults are added by load_settings
+DEFAULT_SETTINGS = MappingProxyType({
+    "enable_boxart": True,
+    "view_type": "list",
+    "usa_only": False,
+    "switch_keys_path": ""
+})
+
 def log_error(error_msg, error_type=None, traceback_str=None):
     timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     log_message = f"[{timestamp}] ERROR: {error_msg}\n"
@@ -47,6 +65,11 @@ def log_error(error_msg, error_type=None, traceback_str=None):
     with open(LOG_FILE, "a") as f:
         f.write(log_message)
 
+def log_debug(message, *args):
+    """Print a debug message in development mode, formatting it only when shown"""
+    if DEV_MODE:
+        print(message % args if args else message)
+
 # Initialize error log with better error handling
 try:
     log_dir = os.path.dirname(LOG_FILE) if os.path.dirname(LOG_FILE) else "."
@@ -78,6 +101,25 @@ try:
     clock = pygame.time.Clock()
     font = pygame.font.Font(None, FONT_SIZE)
 
+    @lru_cache(maxsize=None)
+    def get_font(size):
+        """Return a shared font object for the given size"""
+        return pygame.font.Font(None, size)
+
+    @lru_cache(maxsize=None)
+    def get_overlay(size, color, alpha):
+        """Return a shared semi-transparent overlay surface"""
+        overlay = pygame.Surface(size)
+        overlay.set_alpha(alpha)
+        overlay.fill(color)
+        return overlay
+
+    @lru_cache(maxsize=512)
+    def render_text(text, color, size=FONT_SIZE):
+        """Return a rendered text surface, reused while the same label stays on screen"""
+        text_font = font if size == FONT_SIZE else get_font(size)
+        return text_font.render(text, True, color)
+
     # Initialize joystick if available, otherwise use keyboard
     pygame.joystick.init()
     joystick = None
@@ -86,6 +128,9 @@ try:
         joystick.init()
     else:
         print("No joystick detected, use keyboard: Arrow keys, Enter, Escape, Space")
+    
+    # Drop high-rate motion events nothing reacts to, so they never queue up between frames
+    pygame.event.set_blocked([pygame.MOUSEMOTION, pygame.JOYAXISMOTION, pygame.JOYBALLMOTION])
 
     # Modern color palette
     BACKGROUND = (18, 20, 24)        # Dark background
@@ -129,11 +174,15 @@ try:
     selected_system = 0
     selected_games = set()
     game_list = []
+    game_list_loading = False  # Set while a page of the game list is fetched in the background
+    game_list_request = 0  # Bumped per fetch so a slower, older fetch cannot overwrite the list
+    game_list_results = Queue()  # Finished fetches, applied by the main loop
     mode = "systems"  # systems, games, settings, add_systems, systems_settings, or system_settings
     
     # Add systems state
     available_systems = []
     add_systems_highlighted = 0
+    available_systems_loading = False  # Set while a background fetch is in flight
     
     # Systems settings variables
     systems_settings_highlighted = 0
@@ -143,6 +192,7 @@ try:
     # Pagination variables for Switch
     current_page = 0
     total_pages = 1
+    last_page = None  # Last page with games, known once a next-page fetch comes back empty
     highlighted = 0
     
     # Settings scroll variables
@@ -152,10 +202,26 @@ try:
     search_mode = False
     search_query = ""
     filtered_game_list = []
+    filtered_game_indices = []  # Index in game_list of each filtered_game_list entry
+    last_search_games = None  # List and lowercased query the current filtered_game_indices came from
+    last_search_query = ""
+    filtered_positions = {}  # Position in filtered_game_list of each game_list index
+    filtered_positions_source = None
     char_selector_mode = False
     char_x = 0
     char_y = 0
     
+    # On-screen keyboard layouts (built once, shared by drawing and input handling)
+    SEARCH_CHARS = tuple("abcdefghijklmnopqrstuvwxyz0123456789") + (" ", "DEL", "CLEAR", "DONE")
+    SPECIAL_KEYBOARD_KEYS = frozenset({"DEL", "CLEAR", "DONE", " "})
+    FOLDER_NAME_CHARS = tuple("abcdefghijklmnopqrstuvwxyz0123456789")
+    CHAR_SELECTOR_GRID = (
+        ('A', 'B', 'C', 'D', 'E', 'F', 'G', 'H', 'I', 'J'),
+        ('K', 'L', 'M', 'N', 'O', 'P', 'Q', 'R', 'S', 'T'),
+        ('U', 'V', 'W', 'X', 'Y', 'Z', '0', '1', '2', '3'),
+        ('4', '5', '6', '7', '8', '9', ' ', 'DEL', 'CLEAR', 'DONE')
+    )
+    
     # Search input modal state
     show_search_input = False
     search_input_text = ""
@@ -163,30 +229,12 @@ try:
     search_cursor_blink_time = 0
     
     # Continuous navigation state
-    navigation_state = {
-        'up': False,
-        'down': False, 
-        'left': False,
-        'right': False
-    }
-    navigation_start_time = {
-        'up': 0,
-        'down': 0,
-        'left': 0, 
-        'right': 0
-    }
-    navigation_last_repeat = {
-        'up': 0,
-        'down': 0,
-        'left': 0,
-        'right': 0  
-    }
-    navigation_velocity = {
-        'up': 0,
-        'down': 0,
-        'left': 0,
-        'right': 0
-    }
+    DIRECTIONS = ('up', 'down', 'left', 'right')
+    DIRECTION_HATS = {'up': (0, 1), 'down': (0, -1), 'left': (-1, 0), 'right': (1, 0)}
+    navigation_state = dict.fromkeys(DIRECTIONS, False)
+    navigation_start_time = dict.fromkeys(DIRECTIONS, 0)
+    navigation_last_repeat = dict.fromkeys(DIRECTIONS, 0)
+    navigation_velocity = dict.fromkeys(DIRECTIONS, 0)
     
     # Navigation timing constants with progressive acceleration
     NAVIGATION_INITIAL_DELAY = 100     # ms before repeating starts (much longer delay)
@@ -194,14 +242,13 @@ try:
     NAVIGATION_MAX_RATE = 100          # ms between repeats at maximum speed (fast)
     NAVIGATION_ACCELERATION = 0.90     # rate multiplier each repeat (smaller = faster acceleration)
     
-    def update_navigation_state():
+    def update_navigation_state(current_time):
         """Update navigation state based on current joystick/controller input"""
         global navigation_state, navigation_start_time, navigation_last_repeat, navigation_velocity
-        
-        current_time = pygame.time.get_ticks()
+        global thumbnail_loads_paused
         
         # Reset all navigation states first
-        for direction in ['up', 'down', 'left', 'right']:
+        for direction in DIRECTIONS:
             navigation_state[direction] = False
         
         # Check joystick state if available
@@ -219,7 +266,7 @@ try:
                     navigation_state['right'] = True
             
             # Check button-based D-pad
-            for direction in ['up', 'down', 'left', 'right']:
+            for direction in DIRECTIONS:
                 button_info = get_controller_button(direction)
                 if isinstance(button_info, int) and joystick.get_numbuttons() > button_info:
                     if joystick.get_button(button_info):
@@ -237,7 +284,7 @@ try:
             navigation_state['right'] = True
         
         # Update timing for newly pressed directions
-        for direction in ['up', 'down', 'left', 'right']:
+        for direction in DIRECTIONS:
             if navigation_state[direction]:
                 if navigation_start_time[direction] == 0:
                     # First press - record start time and reset velocity
@@ -249,13 +296,18 @@ try:
                 navigation_start_time[direction] = 0
                 navigation_last_repeat[direction] = 0
                 navigation_velocity[direction] = 0
+        
+        # Hold off new thumbnail downloads while scrolling fast; rows fly past before they finish
+        thumbnail_loads_paused = any(
+            navigation_state[direction] and current_time - navigation_start_time[direction] >= NAVIGATION_INITIAL_DELAY
+            for direction in DIRECTIONS
+        )
     
-    def should_navigate(direction):
+    def should_navigate(direction, current_time):
         """Check if we should trigger navigation for a given direction with progressive acceleration"""
         if not navigation_state[direction]:
             return False
             
-        current_time = pygame.time.get_ticks()
         start_time = navigation_start_time[direction]
         last_repeat = navigation_last_repeat[direction]
         current_velocity = navigation_velocity[direction]
@@ -281,26 +333,17 @@ try:
         """Check if a direction is currently being held"""
         return navigation_state.get(direction, False)
     
-    def handle_continuous_navigation():
+    def handle_continuous_navigation(current_time):
         """Handle continuous navigation by checking held directions"""
         global movement_occurred
         
         # Check each direction for continuous navigation
-        for direction in ['up', 'down', 'left', 'right']:
-            if should_navigate(direction):
-                # Convert direction to hat coordinates
-                if direction == 'up':
-                    hat = (0, 1)
-                elif direction == 'down':
-                    hat = (0, -1) 
-                elif direction == 'left':
-                    hat = (-1, 0)
-                elif direction == 'right':
-                    hat = (1, 0)
-                
+        for direction in DIRECTIONS:
+            if should_navigate(direction, current_time):
                 # Call simplified navigation logic directly
-                handle_directional_navigation_continuous(direction, hat)
-                break  # Only process one direction per frame to avoid conflicts
+                handle_directional_navigation_continuous(direction, DIRECTION_HATS[direction])
+                return True  # Only process one direction per frame to avoid conflicts
+        return False
     
     def handle_directional_navigation_continuous(direction, hat):
         """Simplified navigation function for continuous navigation (no event needed)"""
@@ -312,7 +355,7 @@ try:
         if hat[1] != 0 and not show_game_details:  # Up or Down
             if show_search_input:
                 # Navigate character selection up/down for search
-                chars = list("abcdefghijklmnopqrstuvwxyz0123456789") + [" ", "DEL", "CLEAR", "DONE"]
+                chars = SEARCH_CHARS
                 chars_per_row = 13
                 total_chars = len(chars)
                 if direction == "up":
@@ -376,7 +419,7 @@ try:
                 elif mode == "add_systems":
                     max_items = len(available_systems)
                 elif mode == "systems_settings":
-                    configurable_systems = [d for d in data if not d.get('list_systems', False) and d.get('name') != 'Other Systems']
+                    configurable_systems = get_configurable_systems()
                     max_items = len(configurable_systems)
                 elif mode == "system_settings":
                     max_items = 2  # Hide from menu + Custom ROM folder
@@ -409,7 +452,7 @@ try:
         elif hat[0] != 0 and not show_game_details:  # Left or Right
             if show_search_input:
                 # Navigate character selection left/right for search
-                chars = list("abcdefghijklmnopqrstuvwxyz0123456789") + [" ", "DEL", "CLEAR", "DONE"]
+                chars = SEARCH_CHARS
                 chars_per_row = 13
                 total_chars = len(chars)
                 if direction == "left":
@@ -459,7 +502,7 @@ try:
     
     # Controller mapping will be loaded/created dynamically
     controller_mapping = {}
-    settings_list = [
+    settings_list = (
         "Enable Box-art Display",
         "Update from GitHub",
         "View Type",
@@ -470,14 +513,110 @@ try:
         "Remap Controller",
         "Add Systems",
         "Systems Settings"
-    ]
+    )
 
     # Directories will be created after settings are loaded
 
-    # Image cache for thumbnails
-    image_cache = {}
+    # Image cache for thumbnails, least recently used entries are evicted past the limit
+    image_cache = OrderedDict()
+    IMAGE_CACHE_MAX_ENTRIES = 400
+    drawn_thumbnail_keys = set()  # Cache keys asked for by the last drawn frame, excluding prefetches
     image_queue = Queue()
     THUMBNAIL_SIZE = (96, 96)  # Increased thumbnail size for better quality and visibility
+    BOXART_IMAGE_FORMATS = (".png", ".jpg", ".jpeg", ".gif", ".bmp")  # Extensions tried in order for box-art
+    thumbnail_loads_paused = False  # Set while a held direction is auto-repeating
+    NOT_CACHED = object()  # Sentinel for image_cache lookups, None means a failed load
+    
+    # Fixed pool of background threads for thumbnail loads instead of one thread per image
+    THUMBNAIL_WORKERS = 4
+    thumbnail_requests = Queue()
+    
+    # Keep-alive connections reused by thumbnail loads, one session per worker thread
+    # since requests.Session is not documented as thread-safe
+    thumbnail_sessions = local()
+
+    def get_thumbnail_session():
+        """Get the calling worker's session for thumbnail loads"""
+        session = getattr(thumbnail_sessions, "session", None)
+        if session is None:
+            session = thumbnail_sessions.session = requests.Session()
+            # Each session is used by one thread at a time, so one pooled connection per host is enough
+            adapter = HTTPAdapter(pool_maxsize=1)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+        return session
+
+    def thumbnail_worker():
+        """Run queued thumbnail loads one at a time"""
+        while True:
+            _, target, args = thumbnail_requests.get()
+            try:
+                target(*args)
+            except Exception as e:
+                log_error("Thumbnail worker task failed", type(e).__name__, traceback.format_exc())
+
+    def queue_thumbnail_load(cache_key, target, *args):
+        """Schedule a thumbnail load on the worker pool"""
+        thumbnail_requests.put((cache_key, target, args))
+
+    def cancel_pending_thumbnail_loads():
+        """Drop queued thumbnail loads that have not started yet"""
+        while True:
+            try:
+                cache_key, _, _ = thumbnail_requests.get_nowait()
+            except Empty:
+                break
+            # Forget the loading marker so the image is requested again if it is needed later
+            if image_cache.get(cache_key) == "loading":
+                del image_cache[cache_key]
+
+    for _ in range(THUMBNAIL_WORKERS):
+        thread = Thread(target=thumbnail_worker)
+        thread.daemon = True
+        thread.start()
+
+    # Long-lived threads for other background fetches, so each one does not spawn a new thread
+    BACKGROUND_WORKERS = 2
+    background_tasks = Queue()
+
+    def background_worker():
+        """Run queued background tasks one at a time"""
+        while True:
+            target, args = background_tasks.get()
+            try:
+                target(*args)
+            except Exception as e:
+                log_error("Background task failed", type(e).__name__, traceback.format_exc())
+
+    def run_in_background(target, *args):
+        """Schedule a task on the background worker threads"""
+        background_tasks.put((target, args))
+
+    for _ in range(BACKGROUND_WORKERS):
+        thread = Thread(target=background_worker)
+        thread.daemon = True
+        thread.start()
+
+    # Keep-alive connections reused by listing fetches across system switches and pages,
+    # one per thread like the thumbnail sessions
+    listing_sessions = local()
+
+    def get_listing_session():
+        """Get the calling thread's session for listing fetches"""
+        session = getattr(listing_sessions, "session", None)
+        if session is None:
+            session = listing_sessions.session = requests.Session()
+        return session
+
+    # Grid view prefetch region: starts at one row below the screen and doubles as loads drain
+    GRID_PREFETCH_MAX_ROWS = 8
+    grid_prefetch_rows = 1
+    grid_prefetch_anchor = None  # First visible row the current region was grown for
+    
+    # List view prefetch: screens of thumbnails loaded ahead in the direction of travel
+    LIST_PREFETCH_SCREENS = 1.5
+    list_prefetch_direction = 1
+    list_prefetch_last_highlighted = 0
 
     def format_size(size_bytes):
         """Convert bytes to human readable format"""
@@ -487,6 +626,54 @@ try:
             size_bytes /= 1024
         return f"{size_bytes:.1f} TB"
 
+    def write_text_file(path, text):
+        """Write to a temporary file and swap it in, so a crash mid-write keeps the old file intact"""
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        temp_path = path + ".tmp"
+        try:
+            with open(temp_path, 'w') as f:
+                f.write(text)
+                # Make sure the data is on the card before the rename, or a power loss can leave an empty file
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_path, path)
+        except Exception:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+    def write_json_file(path, content):
+        """Write JSON atomically, see write_text_file"""
+        write_text_file(path, json.dumps(content, indent=2))
+
+    # Settings are serialized on the main thread and written by a dedicated writer thread,
+    # so a save never waits in the background queue behind a slow network fetch
+    settings_writes = Queue()
+    settings_write_lock = Lock()
+    settings_write_version = 0  # Bumped for every save, so an older write never lands after a newer one
+    settings_written_version = 0
+
+    def write_settings_text(text, version):
+        """Write serialized settings unless a newer save already reached the disk"""
+        global settings_written_version
+        with settings_write_lock:
+            if version < settings_written_version:
+                return
+            try:
+                write_text_file(CONFIG_FILE, text)
+                settings_written_version = version
+            except Exception as e:
+                log_error("Failed to save settings", type(e).__name__, traceback.format_exc())
+
+    def settings_writer():
+        """Write queued settings saves one at a time"""
+        while True:
+            write_settings_text(*settings_writes.get())
+
+    settings_writer_thread = Thread(target=settings_writer)
+    settings_writer_thread.daemon = True
+    settings_writer_thread.start()
+
     def load_settings():
         """Load settings from config file"""
         # Default paths based on environment
@@ -503,14 +690,7 @@ try:
             default_work_dir = os.path.join(SCRIPT_DIR, "py_downloads")
             default_roms_dir = os.path.join(SCRIPT_DIR, "roms")
         
-        default_settings = {
-            "enable_boxart": True,
-            "view_type": "list",
-            "usa_only": False,
-            "work_dir": default_work_dir,
-            "roms_dir": default_roms_dir,
-            "switch_keys_path": ""
-        }
+        default_settings = dict(DEFAULT_SETTINGS, work_dir=default_work_dir, roms_dir=default_roms_dir)
         
         try:
             if os.path.exists(CONFIG_FILE):
@@ -526,17 +706,43 @@ try:
         
         return default_settings
 
-    def save_settings(settings_to_save):
-        """Save settings to config file"""
+    def save_settings(settings_to_save, background=True):
+        """Save settings to config file, off the main thread unless background is False"""
+        global settings_write_version
         try:
-            # Create directory if it doesn't exist
-            os.makedirs(os.path.dirname(CONFIG_FILE), exist_ok=True)
-            
-            with open(CONFIG_FILE, 'w') as f:
-                json.dump(settings_to_save, f, indent=2)
+            # Serializing here takes the snapshot before the main loop changes the dict again
+            text = json.dumps(settings_to_save, indent=2)
+            settings_write_version += 1
+            if background:
+                settings_writes.put((text, settings_write_version))
+            else:
+                write_settings_text(text, settings_write_version)
         except Exception as e:
             log_error("Failed to save settings", type(e).__name__, traceback.format_exc())
 
+    # Toggled settings are written once the user stops flipping them instead of on every press
+    SETTINGS_SAVE_DELAY_MS = 1000
+    settings_save_due = None  # Tick time a requested save becomes due, None when nothing is pending
+
+    def request_settings_save():
+        """Save settings after a short delay, so rapid toggles are written once"""
+        global settings_save_due
+        settings_save_due = pygame.time.get_ticks() + SETTINGS_SAVE_DELAY_MS
+
+    def flush_settings_save(current_time=None):
+        """Write a pending settings save once it is due, or right away and in this thread when no time is given"""
+        global settings_save_due
+        if current_time is None:
+            # Quitting: background writes still queued would be lost with the daemon workers
+            if settings_save_due is not None or settings_written_version < settings_write_version:
+                settings_save_due = None
+                save_settings(settings, background=False)
+            return
+        if settings_save_due is None or current_time < settings_save_due:
+            return
+        settings_save_due = None
+        save_settings(settings)
+
     def load_controller_mapping():
         """Load controller mapping from file or create new mapping"""
         global controller_mapping
@@ -546,7 +752,11 @@ try:
         try:
             if os.path.exists(mapping_file):
                 with open(mapping_file, 'r') as f:
-                    controller_mapping = json.load(f)
+                    # JSON stores hat entries as lists; keep them as tuples like freshly collected ones
+                    controller_mapping = {
+                        action: tuple(button_info) if isinstance(button_info, list) else button_info
+                        for action, button_info in json.load(f).items()
+                    }
                     print("Controller mapping loaded from file")
                     return True
             else:
@@ -563,55 +773,100 @@ try:
         mapping_file = os.path.join(os.path.dirname(CONFIG_FILE), "controller_mapping.json")
         
         try:
-            os.makedirs(os.path.dirname(mapping_file), exist_ok=True)
-            with open(mapping_file, 'w') as f:
-                json.dump(controller_mapping, f, indent=2)
+            write_json_file(mapping_file, controller_mapping)
             print("Controller mapping saved")
         except Exception as e:
             log_error("Failed to save controller mapping", type(e).__name__, traceback.format_exc())
 
+    ESSENTIAL_MAPPING_ACTIONS = frozenset({"select", "back", "start", "detail", "search", "up", "down", "left", "right"})
+    
+    # The only events the controller setup screen reacts to
+    MAPPING_EVENT_TYPES = (pygame.QUIT, pygame.JOYBUTTONDOWN, pygame.JOYHATMOTION, pygame.KEYDOWN)
+    
+    # D-pad hat value -> direction action it maps during controller setup
+    HAT_MAPPING_ACTIONS = {(0, 1): "up", (0, -1): "down", (-1, 0): "left", (1, 0): "right"}
+    
+    # Actions collected by the controller setup screen, in the order they are asked for
+    CONTROLLER_MAPPING_BUTTONS = (
+        ("up", "D-pad UP"),
+        ("down", "D-pad DOWN"),
+        ("left", "D-pad LEFT"),
+        ("right", "D-pad RIGHT"),
+        ("select", "SELECT/CONFIRM button (usually A)"),
+        ("back", "BACK/CANCEL button (usually B)"),
+        ("start", "START/MENU button"),
+        ("detail", "DETAIL/SECONDARY button (usually Y)"),
+        ("search", "SEARCH button (for game search)"),
+        ("left_shoulder", "Left Shoulder button (L/LB)"),
+        ("right_shoulder", "Right Shoulder button (R/RB)")
+    )
+
     def needs_controller_mapping():
         """Check if we need to collect controller mapping"""
-        essential_buttons = ["select", "back", "start", "detail", "search", "up", "down", "left", "right"]
-        return not controller_mapping or not all(button in controller_mapping for button in essential_buttons)
+        return not controller_mapping or not ESSENTIAL_MAPPING_ACTIONS.issubset(controller_mapping)
+
+    # Main menu systems, rebuilt when data is replaced or a system's settings are edited
+    visible_systems_cache = []
+    visible_systems_source = None
+
+    def get_system_settings_entry(system_name):
+        """Get the writable per-system settings dict, creating it on first use"""
+        global visible_systems_source
+        visible_systems_source = None  # The caller is about to change what the main menu shows
+        return settings.setdefault("system_settings", {}).setdefault(system_name, {})
 
     def get_visible_systems():
         """Get list of systems that are not hidden and not list_systems"""
-        system_settings = settings.get("system_settings", {})
-        visible_systems = [d for d in data if not d.get('list_systems', False) and not system_settings.get(d['name'], {}).get('hidden', False)]
+        global visible_systems_cache, visible_systems_source
+        if visible_systems_source is data:
+            return visible_systems_cache
+        system_settings = settings.get("system_settings", EMPTY_MAPPING)
+        visible_systems = [d for d in data if not d.get('list_systems', False) and not system_settings.get(d['name'], EMPTY_MAPPING).get('hidden', False)]
         # Remove the last system from the main menu
-        if len(visible_systems) > 0:
-            visible_systems = visible_systems[:-1]
+        if visible_systems:
+            visible_systems.pop()
+        visible_systems_cache = visible_systems
+        visible_systems_source = data
         return visible_systems
 
+    # Systems listed in Systems Settings, rebuilt whenever data is replaced
+    configurable_systems_cache = []
+    configurable_systems_source = None
+
+    def get_configurable_systems():
+        """Get systems that can be configured, leaving out 'Other Systems' and 'list_systems' entries"""
+        global configurable_systems_cache, configurable_systems_source
+        if configurable_systems_source is not data:
+            configurable_systems_cache = [d for d in data if not d.get('list_systems', False) and d.get('name') != 'Other Systems']
+            configurable_systems_source = data
+        return configurable_systems_cache
+
+    # Name -> data index lookup, rebuilt whenever data is replaced
+    system_index_by_name = {}
+    system_index_source = None
+
     def get_system_index_by_name(system_name):
         """Get the original data array index for a system by name"""
-        return next(i for i, d in enumerate(data) if d['name'] == system_name)
+        global system_index_by_name, system_index_source
+        if system_index_source is not data:
+            system_index_by_name = {}
+            for i, d in enumerate(data):
+                system_index_by_name.setdefault(d['name'], i)  # Keep first match like the old linear scan
+            system_index_source = data
+        return system_index_by_name[system_name]
 
     def collect_controller_mapping():
         """Collect controller button mapping from user input"""
         global controller_mapping, show_controller_mapping
         
-        essential_buttons = [
-            ("up", "D-pad UP"),
-            ("down", "D-pad DOWN"), 
-            ("left", "D-pad LEFT"),
-            ("right", "D-pad RIGHT"),
-            ("select", "SELECT/CONFIRM button (usually A)"),
-            ("back", "BACK/CANCEL button (usually B)"),
-            ("start", "START/MENU button"),
-            ("detail", "DETAIL/SECONDARY button (usually Y)"),
-            ("search", "SEARCH button (for game search)"),
-            ("left_shoulder", "Left Shoulder button (L/LB)"),
-            ("right_shoulder", "Right Shoulder button (R/RB)")
-        ]
-        
         controller_mapping = {}
         current_button_index = 0
         collecting_input = True
         last_input_time = 0
+        mapped_surfs = []  # Rendered "action: Button n" rows, one per button mapped so far
+        button_count = len(CONTROLLER_MAPPING_BUTTONS)
         
-        while collecting_input and current_button_index < len(essential_buttons):
+        while collecting_input and current_button_index < button_count:
             current_time = pygame.time.get_ticks()
             
             # Clear screen
@@ -623,57 +878,46 @@ try:
             screen.blit(title_surf, (20, 20))
             
             # Current button instruction
-            button_key, button_description = essential_buttons[current_button_index]
+            button_key, button_description = CONTROLLER_MAPPING_BUTTONS[current_button_index]
             instruction_text = f"Press the {button_description}"
             instruction_surf = font.render(instruction_text, True, TEXT_PRIMARY)
             screen.blit(instruction_surf, (20, 80))
             
             # Progress
-            progress_text = f"Button {current_button_index + 1} of {len(essential_buttons)}"
+            progress_text = f"Button {current_button_index + 1} of {button_count}"
             progress_surf = font.render(progress_text, True, GRAY)
             screen.blit(progress_surf, (20, 120))
             
-            # Show already mapped buttons
+            # Show already mapped buttons, rendering each row once when it is mapped
             y_offset = 160
-            for i, (mapped_key, _) in enumerate(essential_buttons[:current_button_index]):
-                if mapped_key in controller_mapping:
-                    mapped_text = f"{mapped_key}: Button {controller_mapping[mapped_key]}"
-                    mapped_surf = font.render(mapped_text, True, GREEN)
-                    screen.blit(mapped_surf, (20, y_offset + i * 25))
+            while len(mapped_surfs) < current_button_index:
+                mapped_key = CONTROLLER_MAPPING_BUTTONS[len(mapped_surfs)][0]
+                mapped_text = f"{mapped_key}: Button {controller_mapping[mapped_key]}"
+                mapped_surfs.append(font.render(mapped_text, True, GREEN))
+            for i, mapped_surf in enumerate(mapped_surfs):
+                screen.blit(mapped_surf, (20, y_offset + i * 25))
             
             pygame.display.flip()
             
-            # Handle events
-            for event in pygame.event.get():
+            # Handle events, fetching only the types used here and dropping the rest in SDL
+            events = pygame.event.get(MAPPING_EVENT_TYPES)
+            pygame.event.clear()
+            for event in events:
                 if event.type == pygame.QUIT:
                     return False
                 elif event.type == pygame.JOYBUTTONDOWN:
                     # Debounce input (prevent double registration)
                     if current_time - last_input_time > 300:
                         controller_mapping[button_key] = event.button
-                        print(f"Mapped {button_key} to button {event.button}")
+                        log_debug("Mapped %s to button %s", button_key, event.button)
                         current_button_index += 1
                         last_input_time = current_time
                 elif event.type == pygame.JOYHATMOTION:
                     # Handle D-pad input
-                    if current_time - last_input_time > 300:
-                        hat_x, hat_y = event.value
-                        if button_key == "up" and hat_y == 1:
-                            controller_mapping[button_key] = ("hat", 0, 1)
-                            current_button_index += 1
-                            last_input_time = current_time
-                        elif button_key == "down" and hat_y == -1:
-                            controller_mapping[button_key] = ("hat", 0, -1)
-                            current_button_index += 1
-                            last_input_time = current_time
-                        elif button_key == "left" and hat_x == -1:
-                            controller_mapping[button_key] = ("hat", -1, 0)
-                            current_button_index += 1
-                            last_input_time = current_time
-                        elif button_key == "right" and hat_x == 1:
-                            controller_mapping[button_key] = ("hat", 1, 0)
-                            current_button_index += 1
-                            last_input_time = current_time
+                    if current_time - last_input_time > 300 and HAT_MAPPING_ACTIONS.get(event.value) == button_key:
+                        controller_mapping[button_key] = ("hat",) + tuple(event.value)
+                        current_button_index += 1
+                        last_input_time = current_time
                 elif event.type == pygame.KEYDOWN:
                     # Allow keyboard input for testing
                     if event.key == pygame.K_ESCAPE:
@@ -686,6 +930,9 @@ try:
         save_controller_mapping()
         return True
 
+    # Bracketed tags such as [!] or (USA) that are not part of a game's title
+    GAME_NAME_TAGS_RE = re.compile(r'\[.*?\]|\(.*?\)')
+
     def get_game_initials(game_name):
         """Extract first 3 initials from game name"""
         if not game_name:
@@ -693,7 +940,7 @@ try:
         
         # Remove file extension and common brackets/parentheses content
         clean_name = os.path.splitext(game_name)[0]
-        clean_name = re.sub(r'\[.*?\]|\(.*?\)', '', clean_name).strip()
+        clean_name = GAME_NAME_TAGS_RE.sub('', clean_name).strip()
         
         # Split into words and get initials
         words = clean_name.split()
@@ -722,7 +969,7 @@ try:
     def load_image_async(url, cache_key, game_name=None):
         """Load image in background thread"""
         try:
-            response = requests.get(url, timeout=10)
+            response = get_thumbnail_session().get(url, timeout=10)
             response.raise_for_status()
             
             # Load image from bytes
@@ -742,7 +989,7 @@ try:
                 try:
                     initials = get_game_initials(game_name)
                     placeholder_url = f"https://placehold.co/50x50?text={initials}"
-                    response = requests.get(placeholder_url, timeout=5)
+                    response = get_thumbnail_session().get(placeholder_url, timeout=5)
                     response.raise_for_status()
                     
                     # Load placeholder image from bytes
@@ -761,12 +1008,23 @@ try:
             # Put None to indicate failed load
             image_queue.put((cache_key, None))
 
-    def get_thumbnail(game_item, boxart_url):
+    def get_thumbnail(game_item, boxart_url, prefetch=False):
         """Get thumbnail for game, loading async if not cached"""
         # Check if box-art is enabled
         if not settings["enable_boxart"]:
             return None
         
+        # Games seen before keep their cache key on the dict, so cached lookups skip the name and key work
+        if isinstance(game_item, dict):
+            saved_key = game_item.get('thumbnail_key')
+            if saved_key is not None and saved_key[0] == boxart_url:
+                cache_key = saved_key[1]
+                if not prefetch:
+                    drawn_thumbnail_keys.add(cache_key)
+                cached = lookup_image_cache(cache_key)
+                if cached is not NOT_CACHED:
+                    return cached
+        
         # Handle Nintendo Switch boxart with title ID extraction and pre-loaded API data
         if isinstance(game_item, str):
             game_name = game_item
@@ -785,24 +1043,26 @@ try:
         # Check if this is Nintendo Switch and boxart_url contains the API URL
         if boxart_url and "api.ultranx.ru" in boxart_url:
             title_id = extract_switch_title_id(game_name)
+            if title_id and boxart_url in switch_api_loading:
+                return None  # Wait for the background API fetch instead of guessing a URL
             if title_id and boxart_url in switch_api_cache:
                 # Use pre-loaded Switch API data for boxart
-                cache_key = f"switch_{title_id}"
-                
-                # Return cached image if available
-                if settings["cache_enabled"] and cache_key in image_cache:
-                    return image_cache[cache_key]
+                cache_key = ("switch", title_id)
+                if isinstance(game_item, dict):
+                    game_item['thumbnail_key'] = (boxart_url, cache_key)
                 
-                if not settings["cache_enabled"] and cache_key in image_cache:
-                    return image_cache[cache_key]
+                # Return cached image (or "loading" marker) if available
+                if not prefetch:
+                    drawn_thumbnail_keys.add(cache_key)
+                cached = lookup_image_cache(cache_key)
+                if cached is not NOT_CACHED:
+                    return cached
                 
                 # Start loading from pre-loaded Switch API data if not already in cache
-                if cache_key not in image_cache:
+                if not thumbnail_loads_paused:
                     image_cache[cache_key] = "loading"
                     api_data = switch_api_cache[boxart_url]
-                    thread = Thread(target=load_switch_boxart_from_cache, args=(title_id, cache_key, api_data))
-                    thread.daemon = True
-                    thread.start()
+                    queue_thumbnail_load(cache_key, load_switch_boxart_from_cache, title_id, cache_key, api_data)
                 
                 return None  # Not ready yet
             # If no title ID found or API not cached, fall back to regular handling
@@ -811,47 +1071,49 @@ try:
         if isinstance(game_item, dict) and 'banner_url' in game_item and game_item['banner_url']:
             # Switch API format - use direct banner URL (JPG format)
             image_url = game_item['banner_url']
-            cache_key = f"switch_{game_item['title_id']}"
+            cache_key = ("switch", game_item['title_id'])
         elif isinstance(game_item, dict) and 'icon_url' in game_item and game_item['icon_url']:
             # Fallback to icon_url if banner_url not available
             image_url = game_item['icon_url']
-            cache_key = f"switch_{game_item.get('title_id', 'unknown')}"
+            cache_key = ("switch", game_item.get('title_id', 'unknown'))
         elif boxart_url:
             # Regular format - construct URL from boxart base + game name
+            # Also used when a Switch-style dict has empty banner_url/icon_url keys, see the load dispatch below
             base_name = os.path.splitext(game_name)[0]
             image_url = urljoin(boxart_url, f"{base_name}.png")
-            cache_key = f"{boxart_url}_{game_name}"
+            cache_key = (boxart_url, game_name)
         else:
             return None
+        if isinstance(game_item, dict):
+            game_item['thumbnail_key'] = (boxart_url, cache_key)
         
-        # Return cached image if available and cache is enabled
-        if settings["cache_enabled"] and cache_key in image_cache:
-            return image_cache[cache_key]
-        
-        # If cache is disabled but we have the image, return it
-        if not settings["cache_enabled"] and cache_key in image_cache:
-            return image_cache[cache_key]
+        # Return cached image (or "loading" marker) if available
+        if not prefetch:
+            drawn_thumbnail_keys.add(cache_key)
+        cached = lookup_image_cache(cache_key)
+        if cached is not NOT_CACHED:
+            return cached
         
-        # Start loading if not already in cache
-        if cache_key not in image_cache:
+        # Start loading if not already in cache (deferred until fast scrolling stops)
+        if not thumbnail_loads_paused:
             image_cache[cache_key] = "loading"  # Mark as loading
             
             if isinstance(game_item, dict) and ('banner_url' in game_item or 'icon_url' in game_item):
                 # Switch format - load direct URL
                 game_name = game_item.get('name', '')
-                thread = Thread(target=load_image_async, args=(image_url, cache_key, game_name))
-                thread.daemon = True
-                thread.start()
+                queue_thumbnail_load(cache_key, load_image_async, image_url, cache_key, game_name)
             else:
                 # Regular format - try multiple image formats
                 base_name = os.path.splitext(game_name)[0]
-                image_formats = [".png", ".jpg", ".jpeg", ".gif", ".bmp"]
-                thread = Thread(target=load_image_with_fallback, args=(boxart_url, base_name, image_formats, cache_key, game_name))
-                thread.daemon = True
-                thread.start()
+                queue_thumbnail_load(cache_key, load_image_with_fallback, boxart_url, base_name, BOXART_IMAGE_FORMATS, cache_key, game_name)
         
         return None  # Not ready yet
 
+    def prefetch_thumbnails(items, boxart_url):
+        """Queue thumbnail loads for items that are not on screen yet"""
+        for item in items:
+            get_thumbnail(item, boxart_url, prefetch=True)
+
     def load_switch_boxart_from_cache(title_id, cache_key, api_data):
         """Load Nintendo Switch boxart using pre-loaded API data"""
         try:
@@ -866,7 +1128,7 @@ try:
                 
                 if image_url:
                     # Load the image
-                    image_response = requests.get(image_url, timeout=10)
+                    image_response = get_thumbnail_session().get(image_url, timeout=10)
                     image_response.raise_for_status()
                     
                     # Load image from bytes
@@ -886,7 +1148,7 @@ try:
             placeholder_url = f"https://placehold.co/50x50?text={initials}"
             
             try:
-                response = requests.get(placeholder_url, timeout=5)
+                response = get_thumbnail_session().get(placeholder_url, timeout=5)
                 response.raise_for_status()
                 
                 image_data = BytesIO(response.content)
@@ -938,7 +1200,7 @@ try:
             # Check if we already have the API data cached
             if api_url not in switch_api_cache:
                 # Fetch the full API data
-                response = requests.get(api_url, timeout=10)
+                response = get_thumbnail_session().get(api_url, timeout=10)
                 response.raise_for_status()
                 api_data = response.json()
                 switch_api_cache[api_url] = api_data
@@ -956,7 +1218,7 @@ try:
                 
                 if image_url:
                     # Load the image
-                    image_response = requests.get(image_url, timeout=10)
+                    image_response = get_thumbnail_session().get(image_url, timeout=10)
                     image_response.raise_for_status()
                     
                     # Load image from bytes
@@ -975,7 +1237,7 @@ try:
             initials = get_game_initials(game_name)
             placeholder_url = f"https://placehold.co/50x50?text={initials}"
             
-            response = requests.get(placeholder_url, timeout=5)
+            response = get_thumbnail_session().get(placeholder_url, timeout=5)
             response.raise_for_status()
             
             image_data = BytesIO(response.content)
@@ -993,7 +1255,6 @@ try:
                 
                 # Add title ID text if possible
                 try:
-                    import pygame.font
                     font = pygame.font.Font(None, 12)
                     text = font.render(title_id[:8], True, (255, 255, 255))
                     text_rect = text.get_rect(center=(THUMBNAIL_SIZE[0]//2, THUMBNAIL_SIZE[1]//2))
@@ -1011,7 +1272,7 @@ try:
         for fmt in formats:
             try:
                 image_url = urljoin(base_url, f"{base_name}{fmt}")
-                response = requests.get(image_url, timeout=5)
+                response = get_thumbnail_session().get(image_url, timeout=5)
                 response.raise_for_status()
                 
                 # Load image from bytes
@@ -1033,7 +1294,7 @@ try:
             try:
                 initials = get_game_initials(game_name)
                 placeholder_url = f"https://placehold.co/50x50?text={initials}"
-                response = requests.get(placeholder_url, timeout=5)
+                response = get_thumbnail_session().get(placeholder_url, timeout=5)
                 response.raise_for_status()
                 
                 # Load placeholder image from bytes
@@ -1053,13 +1314,39 @@ try:
         image_queue.put((cache_key, None))
 
     def update_image_cache():
-        """Process loaded images from background threads"""
-        while not image_queue.empty():
+        """Process loaded images from background threads, returning True if an on-screen one arrived"""
+        # Drain everything that arrived since the last frame in one pass
+        arrived = False
+        while True:
             try:
                 cache_key, image = image_queue.get_nowait()
-                image_cache[cache_key] = image
-            except:
+            except Empty:
                 break
+            image_cache[cache_key] = image
+            image_cache.move_to_end(cache_key)
+            # Prefetched images only matter once they scroll into view
+            if cache_key in drawn_thumbnail_keys:
+                arrived = True
+        
+        # Evict the least recently used finished images, loading markers stay so the load is not queued twice
+        excess = len(image_cache) - IMAGE_CACHE_MAX_ENTRIES
+        if excess > 0:
+            evicted = []
+            for cache_key, image in image_cache.items():
+                if image != "loading":
+                    evicted.append(cache_key)
+                    if len(evicted) == excess:
+                        break
+            for cache_key in evicted:
+                del image_cache[cache_key]
+        return arrived
+
+    def lookup_image_cache(cache_key):
+        """Return the cached image, "loading" marker or NOT_CACHED, marking hits as recently used"""
+        cached = image_cache.get(cache_key, NOT_CACHED)
+        if cached is not NOT_CACHED:
+            image_cache.move_to_end(cache_key)
+        return cached
 
     def reset_image_cache():
         """Clear all cached images"""
@@ -1089,7 +1376,7 @@ try:
             failed_files = []
             
             for i, (filename, url) in enumerate(files_to_update.items()):
-                progress = int((i / total_files) * 100)
+                progress = i * 100 // total_files
                 draw_progress_bar(f"Updating {filename}...", progress)
                 
                 try:
@@ -1139,6 +1426,7 @@ try:
                     pygame.time.wait(2000)
                     draw_loading_message("Application will exit now. Please restart to use the updated version.")
                     pygame.time.wait(2000)
+                    flush_settings_save()
                     pygame.quit()
                     sys.exit(0)
             elif updated_files and failed_files:
@@ -1153,12 +1441,26 @@ try:
             draw_loading_message("Update failed. Check internet connection.")
             pygame.time.wait(3000)
 
+    # Lighter highlight shade for each progress bar fill color
+    PROGRESS_HIGHLIGHT_COLORS = {
+        color: tuple(min(255, c + 30) for c in color)
+        for color in (WARNING, PRIMARY, SUCCESS)
+    }
+
+    last_progress_frame = None  # Arguments of the progress screen currently on display
+
     def draw_progress_bar(text, percent, downloaded=0, total_size=0, speed=0):
+        global last_progress_frame
+        # Skip redrawing and flipping an identical progress screen
+        frame = (text, percent, downloaded, total_size, speed)
+        if frame == last_progress_frame:
+            return
+        last_progress_frame = frame
+        
         screen.fill(BACKGROUND)
         
         # Draw title with modern styling
-        title_font = pygame.font.Font(None, int(FONT_SIZE * 1.3))
-        title_surf = title_font.render("Download Progress", True, TEXT_PRIMARY)
+        title_surf = render_text("Download Progress", TEXT_PRIMARY, int(FONT_SIZE * 1.3))
         screen.blit(title_surf, (20, 20))
         
         # Draw subtle underline for title
@@ -1187,7 +1489,7 @@ try:
         pygame.draw.rect(screen, TEXT_DISABLED, bg_rect, 1, border_radius=6)
         
         # Draw progress with gradient-like effect
-        progress_width = int(bar_width * (percent / 100))
+        progress_width = bar_width * percent // 100
         if progress_width > 0:
             progress_rect = pygame.Rect(bar_x, bar_y, progress_width, bar_height)
             # Use different colors based on progress
@@ -1203,7 +1505,7 @@ try:
             # Add a highlight for better depth
             if progress_width > 4:
                 highlight_rect = pygame.Rect(bar_x, bar_y, progress_width, bar_height // 3)
-                highlight_color = tuple(min(255, c + 30) for c in progress_color)
+                highlight_color = PROGRESS_HIGHLIGHT_COLORS[progress_color]
                 pygame.draw.rect(screen, highlight_color, highlight_rect, border_radius=6)
         
         # Draw percentage text with better positioning
@@ -1230,19 +1532,44 @@ try:
         
         y = bar_y + bar_height + 40
         for instruction in instructions:
-            inst_surf = font.render(instruction, True, TEXT_DISABLED)
+            inst_surf = render_text(instruction, TEXT_DISABLED)
             screen.blit(inst_surf, (20, y))
             y += FONT_SIZE + 5
         
         pygame.display.flip()
 
+    def format_path_setting(path):
+        """Shorten a path setting to its last 30 characters for the settings menu"""
+        return path[-30:] + "..." if len(path) > 30 else path
+
+    def format_switch_keys_setting():
+        """Describe the configured Nintendo Switch keys file"""
+        keys_path = settings.get("switch_keys_path", "")
+        if keys_path and os.path.exists(keys_path):
+            return format_path_setting(keys_path)
+        return "Not configured"
+
+    # Value shown next to each settings_list entry, called with the select button name
+    SETTING_VALUE_FORMATTERS = {
+        "Enable Box-art Display": lambda select_button_name: "ON" if settings["enable_boxart"] else "OFF",
+        "Update from GitHub": lambda select_button_name: f"Press {select_button_name} to update",
+        "View Type": lambda select_button_name: settings["view_type"].upper(),
+        "USA Games Only": lambda select_button_name: "ON" if settings["usa_only"] else "OFF",
+        "Work Directory": lambda select_button_name: format_path_setting(settings.get("work_dir", "")),
+        "ROMs Directory": lambda select_button_name: format_path_setting(settings.get("roms_dir", "")),
+        "Nintendo Switch Keys": lambda select_button_name: format_switch_keys_setting(),
+        "Remap Controller": lambda select_button_name: f"{len(controller_mapping)} buttons mapped" if controller_mapping else "Not configured",
+        "Add Systems": lambda select_button_name: f"Press {select_button_name} to add",
+        "Systems Settings": lambda select_button_name: f"Press {select_button_name} to configure"
+    }
+
     def draw_settings_menu():
         global settings_scroll_offset
         screen.fill(BACKGROUND)
         y = 10
         
         # Draw title
-        title_surf = font.render("Settings", True, TEXT_PRIMARY)
+        title_surf = render_text("Settings", TEXT_PRIMARY)
         screen.blit(title_surf, (20, y))
         y += FONT_SIZE + 10
         
@@ -1256,7 +1583,7 @@ try:
         ]
         
         for instruction in instructions:
-            inst_surf = font.render(instruction, True, TEXT_DISABLED)
+            inst_surf = render_text(instruction, TEXT_DISABLED)
             screen.blit(inst_surf, (20, y))
             y += FONT_SIZE + 5
         
@@ -1294,42 +1621,10 @@ try:
             color = PRIMARY if actual_idx == highlighted else TEXT_PRIMARY
             
             # Get current setting value
-            setting_value = ""
-            if actual_idx == 0:  # Enable Box-art Display
-                setting_value = "ON" if settings["enable_boxart"] else "OFF"
-            elif actual_idx == 1:  # Update from GitHub
-                select_button_name = get_button_name("select")
-                setting_value = f"Press {select_button_name} to update"
-            elif actual_idx == 2:  # View Type
-                setting_value = settings["view_type"].upper()
-            elif actual_idx == 3:  # USA Games Only
-                setting_value = "ON" if settings["usa_only"] else "OFF"
-            elif actual_idx == 4:  # Work Directory
-                work_dir = settings.get("work_dir", "")
-                setting_value = work_dir[-30:] + "..." if len(work_dir) > 30 else work_dir
-            elif actual_idx == 5:  # ROMs Directory
-                roms_dir = settings.get("roms_dir", "")
-                setting_value = roms_dir[-30:] + "..." if len(roms_dir) > 30 else roms_dir
-            elif actual_idx == 6:  # Nintendo Switch Keys
-                keys_path = settings.get("switch_keys_path", "")
-                if keys_path and os.path.exists(keys_path):
-                    setting_value = keys_path[-30:] + "..." if len(keys_path) > 30 else keys_path
-                else:
-                    setting_value = "Not configured"
-            elif actual_idx == 7:  # Remap Controller
-                if controller_mapping:
-                    setting_value = f"{len(controller_mapping)} buttons mapped"
-                else:
-                    setting_value = "Not configured"
-            elif actual_idx == 8:  # Add Systems
-                select_button_name = get_button_name("select")
-                setting_value = f"Press {select_button_name} to add"
-            elif actual_idx == 9:  # Systems Settings
-                select_button_name = get_button_name("select")
-                setting_value = f"Press {select_button_name} to configure"
+            setting_value = SETTING_VALUE_FORMATTERS[setting_name](select_button_name)
             
             setting_text = f"{setting_name}: {setting_value}"
-            setting_surf = font.render(setting_text, True, color)
+            setting_surf = render_text(setting_text, color)
             screen.blit(setting_surf, (20, y))
             y += row_height
         
@@ -1340,7 +1635,7 @@ try:
         y = 10
         
         # Draw title
-        title_surf = font.render("Add Systems", True, TEXT_PRIMARY)
+        title_surf = render_text("Add Systems", TEXT_PRIMARY)
         screen.blit(title_surf, (20, y))
         y += FONT_SIZE + 10
         
@@ -1354,7 +1649,7 @@ try:
         ]
         
         for instruction in instructions:
-            inst_surf = font.render(instruction, True, TEXT_DISABLED)
+            inst_surf = render_text(instruction, TEXT_DISABLED)
             screen.blit(inst_surf, (20, y))
             y += FONT_SIZE + 5
         
@@ -1362,7 +1657,7 @@ try:
         
         # Show loading message if no systems loaded yet
         if not available_systems:
-            loading_surf = font.render("Loading available systems...", True, TEXT_PRIMARY)
+            loading_surf = render_text("Loading available systems...", TEXT_PRIMARY)
             screen.blit(loading_surf, (20, y))
         else:
             # Calculate visible items for scrolling
@@ -1379,7 +1674,7 @@ try:
                 system = available_systems[i]
                 color = PRIMARY if i == add_systems_highlighted else TEXT_PRIMARY
                 system_text = f"{system['name']} - {system.get('size', 'Unknown size')}"
-                system_surf = font.render(system_text, True, color)
+                system_surf = render_text(system_text, color)
                 screen.blit(system_surf, (20, y))
                 y += FONT_SIZE + 10
             
@@ -1387,11 +1682,11 @@ try:
             if len(available_systems) > items_per_screen:
                 if start_idx > 0:
                     # Show up indicator
-                    up_arrow = font.render("UP", True, GRAY)
+                    up_arrow = render_text("UP", GRAY)
                     screen.blit(up_arrow, (screen_width - 40, 10))
                 if end_idx < len(available_systems):
                     # Show down indicator
-                    down_arrow = font.render("DOWN", True, GRAY)
+                    down_arrow = render_text("DOWN", GRAY)
                     screen.blit(down_arrow, (screen_width - 50, screen_height - 30))
         
 
@@ -1401,7 +1696,7 @@ try:
         y = 10
         
         # Draw title
-        title_surf = font.render("Systems Settings", True, TEXT_PRIMARY)
+        title_surf = render_text("Systems Settings", TEXT_PRIMARY)
         screen.blit(title_surf, (20, y))
         y += FONT_SIZE + 10
         
@@ -1415,14 +1710,13 @@ try:
         ]
         
         for instruction in instructions:
-            inst_surf = font.render(instruction, True, TEXT_DISABLED)
+            inst_surf = render_text(instruction, TEXT_DISABLED)
             screen.blit(inst_surf, (20, y))
             y += FONT_SIZE + 5
         
         y += 20
         
-        # Filter out 'Other Systems' and 'list_systems' entries
-        configurable_systems = [d for d in data if not d.get('list_systems', False) and d.get('name') != 'Other Systems']
+        configurable_systems = get_configurable_systems()
         
         # Calculate visible items
         screen_width, screen_height = screen.get_size()
@@ -1440,10 +1734,10 @@ try:
             color = PRIMARY if actual_idx == systems_settings_highlighted else TEXT_PRIMARY
             
             # Get system status
-            system_settings = settings.get("system_settings", {})
+            system_settings = settings.get("system_settings", EMPTY_MAPPING)
             system_name = system['name']
-            is_hidden = system_settings.get(system_name, {}).get('hidden', False)
-            custom_folder = system_settings.get(system_name, {}).get('custom_folder', '')
+            is_hidden = system_settings.get(system_name, EMPTY_MAPPING).get('hidden', False)
+            custom_folder = system_settings.get(system_name, EMPTY_MAPPING).get('custom_folder', '')
             
             status_parts = []
             if is_hidden:
@@ -1454,17 +1748,17 @@ try:
             status = f" ({', '.join(status_parts)})" if status_parts else ""
             system_text = f"{system_name}{status}"
             
-            system_surf = font.render(system_text, True, color)
+            system_surf = render_text(system_text, color)
             screen.blit(system_surf, (20, y))
             y += row_height
         
         # Show scroll indicator if needed
         if len(configurable_systems) > items_per_screen:
             if start_idx > 0:
-                up_arrow = font.render("UP", True, GRAY)
+                up_arrow = render_text("UP", GRAY)
                 screen.blit(up_arrow, (screen_width - 40, 10))
             if end_idx < len(configurable_systems):
-                down_arrow = font.render("DOWN", True, GRAY)
+                down_arrow = render_text("DOWN", GRAY)
                 screen.blit(down_arrow, (screen_width - 50, screen_height - 30))
         
 
@@ -1477,7 +1771,7 @@ try:
         y = 10
         
         # Draw title
-        title_surf = font.render(f"Settings for {selected_system_for_settings['name']}", True, TEXT_PRIMARY)
+        title_surf = render_text(f"Settings for {selected_system_for_settings['name']}", TEXT_PRIMARY)
         screen.blit(title_surf, (20, y))
         y += FONT_SIZE + 10
         
@@ -1491,16 +1785,16 @@ try:
         ]
         
         for instruction in instructions:
-            inst_surf = font.render(instruction, True, TEXT_DISABLED)
+            inst_surf = render_text(instruction, TEXT_DISABLED)
             screen.blit(inst_surf, (20, y))
             y += FONT_SIZE + 5
         
         y += 20
         
         # Get current system settings
-        system_settings = settings.get("system_settings", {})
+        system_settings = settings.get("system_settings", EMPTY_MAPPING)
         system_name = selected_system_for_settings['name']
-        current_settings = system_settings.get(system_name, {})
+        current_settings = system_settings.get(system_name, EMPTY_MAPPING)
         
         # Settings options
         settings_options = [
@@ -1523,37 +1817,34 @@ try:
                     value = f"Default ({selected_system_for_settings.get('roms_folder', 'N/A')})"
             
             option_text = f"{option}: {value}"
-            option_surf = font.render(option_text, True, color)
+            option_surf = render_text(option_text, color)
             screen.blit(option_surf, (20, y))
             y += FONT_SIZE + 10
         
 
     def draw_grid_view(title, items, selected_indices):
+        global grid_prefetch_anchor, grid_prefetch_rows
         screen.fill(BACKGROUND)
         y = 20
         
         # Draw title with modern styling and gradient effect
-        title_font = pygame.font.Font(None, int(FONT_SIZE * 1.4))
-        title_surf = title_font.render(title, True, TEXT_PRIMARY)
+        title_surf = render_text(title, TEXT_PRIMARY, int(FONT_SIZE * 1.4))
         screen.blit(title_surf, (20, y))
         
-        # Draw gradient underline for title
+        # Draw underline for title (single rect; per-pixel alpha is ignored on the display surface)
         title_width = title_surf.get_width()
         underline_y = y + title_surf.get_height() + 8
-        for i in range(title_width):
-            alpha = int(255 * (1 - i / title_width))
-            color = (PRIMARY[0], PRIMARY[1], PRIMARY[2], alpha)
-            pygame.draw.line(screen, color, (20 + i, underline_y), (20 + i, underline_y + 3), 1)
+        pygame.draw.rect(screen, PRIMARY, (20, underline_y, title_width, 4))
         
         y += title_surf.get_height() + 25
         
         # Draw download instruction if games are selected with enhanced styling
-        if selected_indices:
+        if selected_games:
             start_button_name = get_button_name("start")
             instruction = f"Press {start_button_name} to start downloading"
             
             # Create a modern notification box for the instruction
-            inst_surf = font.render(instruction, True, TEXT_PRIMARY)
+            inst_surf = render_text(instruction, TEXT_PRIMARY)
             inst_width = inst_surf.get_width()
             inst_height = inst_surf.get_height()
             
@@ -1590,22 +1881,23 @@ try:
         items_per_screen = cols * rows_per_screen
         
         # Calculate grid position of highlighted item
-        highlighted_row = highlighted // cols
-        highlighted_col = highlighted % cols
+        highlighted_row, highlighted_col = divmod(highlighted, cols)
         
         # Calculate scroll offset to keep highlighted item in the second row (index 1)
         target_row = 1  # Second row (0-indexed)
         start_row = max(0, highlighted_row - target_row)
         visible_items = items[start_row * cols:(start_row + rows_per_screen) * cols]
         
+        # Resolve the system's boxart location once for all visible items
+        boxart_url = data[selected_system].get('boxarts', '') if selected_system < len(data) else ''
+        
         # Draw grid items
         for i, item in enumerate(visible_items):
             actual_idx = start_row * cols + i
             if actual_idx >= len(items):
                 break
                 
-            row = i // cols
-            col = i % cols
+            row, col = divmod(i, cols)
             
             x = start_x + col * cell_width
             y = start_y + row * cell_height
@@ -1618,7 +1910,7 @@ try:
                     original_name = item['name']
                 elif 'filename' in item:
                     # New format with filename and href
-                    display_text = os.path.splitext(item['filename'])[0]
+                    display_text = get_display_name(item)
                     original_name = item['filename']
                 else:
                     display_text = str(item)
@@ -1663,7 +1955,6 @@ try:
             
             # Draw thumbnail if available with enhanced styling
             thumb_y = y + 15  # Slightly more padding from top
-            boxart_url = data[selected_system].get('boxarts', '') if selected_system < len(data) else ''
             thumbnail = get_thumbnail(item, boxart_url)
             
             if thumbnail and thumbnail != "loading":
@@ -1722,27 +2013,26 @@ try:
                 text_color = TEXT_SECONDARY
                 text_shadow_color = (0, 0, 0, 60)
                 
-            test_surf = font.render(display_text, True, text_color)
-            if test_surf.get_width() > max_text_width:
-                # Truncate text
-                for length in range(len(display_text), 0, -1):
-                    truncated = display_text[:length] + "..."
-                    test_surf = font.render(truncated, True, text_color)
-                    if test_surf.get_width() <= max_text_width:
-                        display_text = truncated
-                        break
+            text_surf = render_text(truncate_text(display_text, max_text_width), text_color)
             
-            text_surf = font.render(display_text, True, text_color)
             text_x = x + (cell_width - text_surf.get_width()) // 2  # Center text
             
             # Draw main text (removed shadow to prevent flickering)
             screen.blit(text_surf, (text_x, text_y))
         
+        # Prefetch rows below the screen, growing the region while the view stays put
+        if start_row != grid_prefetch_anchor:
+            grid_prefetch_anchor = start_row
+            grid_prefetch_rows = 1
+        prefetch_start = (start_row + rows_per_screen) * cols
+        prefetch_thumbnails(items[prefetch_start:prefetch_start + grid_prefetch_rows * cols], boxart_url)
+        if thumbnail_requests.empty() and grid_prefetch_rows < GRID_PREFETCH_MAX_ROWS:
+            grid_prefetch_rows *= 2
+        
         # Draw bottom status message if games are selected
-        if selected_indices:
-            message = f"{len(selected_indices)} games selected"
-            message_surf = font.render(message, True, SUCCESS)
-            screen_width, screen_height = screen.get_size()
+        if selected_games:
+            message = f"{len(selected_games)} games selected"
+            message_surf = render_text(message, SUCCESS)
             message_y = screen_height - 35
             
             # Draw background for status message
@@ -1752,18 +2042,14 @@ try:
             pygame.draw.rect(screen, SUCCESS, status_rect, 1)
             
             screen.blit(message_surf, (20, message_y))
-        
-        
-        if not show_game_details:
-            pygame.display.flip()
 
     def draw_menu(title, items, selected_indices):
+        global list_prefetch_direction, list_prefetch_last_highlighted
         screen.fill(BACKGROUND)
         y = 30  # Start with more margin
         
         # Enhanced title styling with gradient-like effect
-        title_font = pygame.font.Font(None, int(FONT_SIZE * 1.5))  # Even larger title
-        title_surf = title_font.render(title, True, TEXT_PRIMARY)
+        title_surf = render_text(title, TEXT_PRIMARY, int(FONT_SIZE * 1.5))  # Even larger title
         
         # Add a subtle background for the title area
         screen_width = screen.get_width()
@@ -1792,7 +2078,7 @@ try:
             instruction = f"Press {start_button_name} to start downloading"
             
             # Create a subtle background box for the instruction
-            inst_surf = font.render(instruction, True, WARNING)
+            inst_surf = render_text(instruction, WARNING)
             inst_width = inst_surf.get_width()
             inst_height = inst_surf.get_height()
             
@@ -1809,7 +2095,7 @@ try:
             search_button_name = get_button_name("search")
             search_instruction = f"Press {search_button_name} to search games"
             
-            inst_surf = font.render(search_instruction, True, TEXT_DISABLED)
+            inst_surf = render_text(search_instruction, TEXT_DISABLED)
             screen.blit(inst_surf, (20, y))
             y += FONT_SIZE + 8
         
@@ -1822,6 +2108,13 @@ try:
         start_idx = max(0, highlighted - items_per_page // 2)
         visible_items = items[start_idx:start_idx + items_per_page]
         
+        # Resolve the system's boxart location once for all visible items
+        boxart_url = data[selected_system].get('boxarts', '') if selected_system < len(data) else ''
+        
+        # Row width is the same for every item
+        item_margin = 15
+        item_width = screen_width - (item_margin * 2)
+        
         # Draw items with enhanced styling
         for i, item in enumerate(visible_items):
             actual_idx = start_idx + i
@@ -1829,12 +2122,11 @@ try:
             is_selected = actual_idx in selected_indices
             
             # Enhanced background for items with subtle shadows and gradients
-            item_margin = 15
-            item_rect = pygame.Rect(item_margin, y - 5, screen.get_width() - (item_margin * 2), row_height)
+            item_rect = pygame.Rect(item_margin, y - 5, item_width, row_height)
             
             if is_highlighted:
                 # Shadow effect for highlighted items
-                shadow_rect = pygame.Rect(item_margin + 2, y - 3, screen.get_width() - (item_margin * 2), row_height)
+                shadow_rect = pygame.Rect(item_margin + 2, y - 3, item_width, row_height)
                 pygame.draw.rect(screen, (0, 0, 0, 30), shadow_rect)
                 
                 # Gradient-like background for highlighted items
@@ -1842,7 +2134,7 @@ try:
                 pygame.draw.rect(screen, PRIMARY, item_rect, 3)
                 
                 # Add subtle inner glow
-                inner_rect = pygame.Rect(item_margin + 3, y - 2, screen.get_width() - (item_margin * 2) - 6, row_height - 6)
+                inner_rect = pygame.Rect(item_margin + 3, y - 2, item_width - 6, row_height - 6)
                 pygame.draw.rect(screen, PRIMARY_LIGHT, inner_rect, 1)
             elif mode == "systems":
                 # For systems menu, use simple list style without borders
@@ -1890,7 +2182,7 @@ try:
                     original_name = item['name']
                 elif 'filename' in item:
                     # New format with filename and href
-                    display_text = os.path.splitext(item['filename'])[0]
+                    display_text = get_display_name(item)
                     original_name = item['filename']
                 else:
                     display_text = str(item)
@@ -1903,7 +2195,6 @@ try:
             # Determine text positioning
             if mode == "games":
                 text_x = 45  # Start after checkbox
-                boxart_url = data[selected_system].get('boxarts', '') if selected_system < len(data) else ''
                 thumbnail = get_thumbnail(original_name, boxart_url)
                 
                 if thumbnail and thumbnail != "loading":
@@ -1956,19 +2247,30 @@ try:
             
             # For highlighted items in systems mode, use slightly larger font
             if mode == "systems" and is_highlighted:
-                highlight_font = pygame.font.Font(None, int(FONT_SIZE * 1.1))
-                item_surf = highlight_font.render(display_text, True, text_color)
+                item_surf = render_text(display_text, text_color, int(FONT_SIZE * 1.1))
             else:
-                item_surf = font.render(display_text, True, text_color)
+                item_surf = render_text(display_text, text_color)
             
             screen.blit(item_surf, (text_x, text_y))
             y += row_height
 
+        # Start loading thumbnails ahead of the scroll direction before they come into view
+        if mode == "games":
+            if highlighted != list_prefetch_last_highlighted:
+                list_prefetch_direction = 1 if highlighted > list_prefetch_last_highlighted else -1
+                list_prefetch_last_highlighted = highlighted
+            prefetch_count = int(items_per_page * LIST_PREFETCH_SCREENS)
+            if list_prefetch_direction > 0:
+                prefetch_start = start_idx + items_per_page
+                prefetch_thumbnails(items[prefetch_start:prefetch_start + prefetch_count], boxart_url)
+            else:
+                # Nearest rows first so they are queued ahead of the farther ones
+                prefetch_thumbnails(reversed(items[max(0, start_idx - prefetch_count):start_idx]), boxart_url)
+
         # Draw bottom status message if games are selected
         if mode == "games" and selected_games:
             message = f"{len(selected_games)} games selected"
-            message_surf = font.render(message, True, SUCCESS)
-            screen_width, screen_height = screen.get_size()
+            message_surf = render_text(message, SUCCESS)
             message_y = screen_height - 35
             
             # Draw background for status message
@@ -1982,16 +2284,57 @@ try:
         # Draw pagination info for Switch
         if mode == "games" and len(data) > 0 and data[selected_system].get('supports_pagination', False):
             page_message = f"Page {current_page + 1} - Use L/R to change page"
-            page_surf = font.render(page_message, True, TEXT_DISABLED)
-            screen_width, screen_height = screen.get_size()
+            page_surf = render_text(page_message, TEXT_DISABLED)
             
             # Position pagination below status message if present
             page_y = screen_height - 20 if not selected_games else screen_height - 65
             screen.blit(page_surf, (20, page_y))
 
+    @lru_cache(maxsize=512)
+    def truncate_text(text, max_width):
+        """Cut text to fit max_width with a trailing ellipsis, found by binary search over font.size"""
+        if font.size(text)[0] <= max_width:
+            return text
+        # Longest prefix that fits with the ellipsis, the full text is known not to
+        low, high = 0, len(text) - 1
+        while low < high:
+            mid = (low + high + 1) // 2
+            if font.size(text[:mid] + "...")[0] <= max_width:
+                low = mid
+            else:
+                high = mid - 1
+        return text[:low] + "..." if low else text
 
-        if not show_game_details:
-            pygame.display.flip()
+    @lru_cache(maxsize=32)
+    def wrap_text(text, max_width):
+        """Split text into lines that fit max_width, measured once per text and width"""
+        lines = []
+        current_line = []
+        
+        for word in text.split():
+            test_line = ' '.join(current_line + [word])
+            if font.size(test_line)[0] <= max_width:
+                current_line.append(word)
+            else:
+                if current_line:
+                    lines.append(' '.join(current_line))
+                    current_line = [word]
+                else:
+                    lines.append(word)  # Single word too long
+        
+        if current_line:
+            lines.append(' '.join(current_line))
+        return tuple(lines)
+
+    @lru_cache(maxsize=8)
+    def get_scaled_image(image, size):
+        """Return a scaled copy of an image, reused while the details modal stays open"""
+        # Use smoothscale for better image quality
+        try:
+            return pygame.transform.smoothscale(image, size)
+        except:
+            # Fallback to regular scale if smoothscale fails
+            return pygame.transform.scale(image, size)
 
     def draw_game_details_modal(game_item):
         """Draw the game details modal overlay with enhanced styling"""
@@ -1999,10 +2342,7 @@ try:
         screen_width, screen_height = screen.get_size()
         
         # Enhanced semi-transparent background overlay with blur effect
-        overlay = pygame.Surface((screen_width, screen_height))
-        overlay.set_alpha(160)  # More opaque for better contrast
-        overlay.fill(BACKGROUND)
-        screen.blit(overlay, (0, 0))
+        screen.blit(get_overlay((screen_width, screen_height), BACKGROUND, 160), (0, 0))  # More opaque for better contrast
         
         # Responsive modal sizing with better proportions
         modal_width = min(max(int(screen_width * 0.85), 350), 600)
@@ -2022,15 +2362,14 @@ try:
             if 'name' in game_item:
                 game_name = game_item.get('name', 'Unknown Game')
             elif 'filename' in game_item:
-                game_name = os.path.splitext(game_item['filename'])[0]
+                game_name = get_display_name(game_item)
             else:
                 game_name = 'Unknown Game'
         else:
             game_name = os.path.splitext(game_item)[0] if isinstance(game_item, str) else 'Unknown Game'
         
         # Draw enhanced title with styling
-        title_font = pygame.font.Font(None, int(FONT_SIZE * 1.2))
-        title_surf = title_font.render("Game Details", True, TEXT_PRIMARY)
+        title_surf = render_text("Game Details", TEXT_PRIMARY, int(FONT_SIZE * 1.2))
         title_x = modal_x + 25
         title_y = modal_y + 25
         screen.blit(title_surf, (title_x, title_y))
@@ -2046,29 +2385,12 @@ try:
         max_name_width = modal_width - (margin * 2)
         
         # Simple text wrapping
-        words = game_name.split()
-        lines = []
-        current_line = []
-        
-        for word in words:
-            test_line = ' '.join(current_line + [word])
-            test_surf = font.render(test_line, True, TEXT_PRIMARY)
-            if test_surf.get_width() <= max_name_width:
-                current_line.append(word)
-            else:
-                if current_line:
-                    lines.append(' '.join(current_line))
-                    current_line = [word]
-                else:
-                    lines.append(word)  # Single word too long
-        
-        if current_line:
-            lines.append(' '.join(current_line))
+        lines = wrap_text(game_name, max_name_width)
         
         # Draw wrapped text
         max_lines = max(2, min(3, modal_height // 100))  # Responsive line count based on modal height
         for i, line in enumerate(lines[:max_lines]):
-            name_surf = font.render(line, True, GREEN)
+            name_surf = render_text(line, GREEN)
             screen.blit(name_surf, (modal_x + margin, name_y + i * (FONT_SIZE + 5)))
         
         # Draw large image if available with enhanced styling
@@ -2091,12 +2413,7 @@ try:
                 new_height = int(original_size[1] * scale_factor)
                 large_size = (new_width, new_height)
                 
-                # Use smoothscale for better image quality
-                try:
-                    large_image = pygame.transform.smoothscale(thumbnail, large_size)
-                except:
-                    # Fallback to regular scale if smoothscale fails
-                    large_image = pygame.transform.scale(thumbnail, large_size)
+                large_image = get_scaled_image(thumbnail, large_size)
                 image_x = modal_x + (modal_width - large_size[0]) // 2
                 
                 # Draw the scaled image directly
@@ -2115,7 +2432,7 @@ try:
         else:
             # Enhanced "No image available" display
             no_image_text = "No image available"
-            no_image_surf = font.render(no_image_text, True, TEXT_SECONDARY)
+            no_image_surf = render_text(no_image_text, TEXT_SECONDARY)
             no_image_x = modal_x + (modal_width - no_image_surf.get_width()) // 2
             
             # Draw placeholder box
@@ -2128,7 +2445,7 @@ try:
         # Enhanced instructions with responsive positioning
         back_button_name = get_button_name("back")
         instruction_text = f"Press {back_button_name} to close"
-        instruction_surf = font.render(instruction_text, True, TEXT_PRIMARY)
+        instruction_surf = render_text(instruction_text, TEXT_PRIMARY)
         instruction_x = modal_x + (modal_width - instruction_surf.get_width()) // 2
         
         # Position instructions either below modal or at bottom of screen if modal is too tall
@@ -2160,10 +2477,7 @@ try:
         screen_width, screen_height = screen.get_size()
         
         # Semi-transparent background overlay
-        overlay = pygame.Surface((screen_width, screen_height))
-        overlay.set_alpha(128)
-        overlay.fill(BLACK)
-        screen.blit(overlay, (0, 0))
+        screen.blit(get_overlay((screen_width, screen_height), BLACK, 128), (0, 0))
         
         # Modal sizing
         modal_width = min(int(screen_width * 0.9), 600)
@@ -2185,7 +2499,7 @@ try:
                 title_text = f"Select ROM Folder for {selected_system_to_add['name']}"
         else:
             title_text = "Select Folder"
-        title_surf = font.render(title_text, True, TEXT_PRIMARY)
+        title_surf = render_text(title_text, TEXT_PRIMARY)
         title_x = modal_x + 20
         title_y = modal_y + 20
         screen.blit(title_surf, (title_x, title_y))
@@ -2195,7 +2509,7 @@ try:
         if len(current_path_display) > 50:
             current_path_display = "..." + current_path_display[-47:]
         
-        path_surf = font.render(f"Path: {current_path_display}", True, GRAY)
+        path_surf = render_text(f"Path: {current_path_display}", GRAY)
         path_y = title_y + 35
         screen.blit(path_surf, (title_x, path_y))
         
@@ -2237,7 +2551,7 @@ try:
         
         inst_y = path_y + 35
         for instruction in instructions:
-            inst_surf = font.render(instruction, True, TEXT_DISABLED)
+            inst_surf = render_text(instruction, TEXT_DISABLED)
             screen.blit(inst_surf, (title_x, inst_y))
             inst_y += 20
         
@@ -2264,11 +2578,6 @@ try:
         end_idx = min(start_idx + items_per_screen, total_items)
         visible_items = folder_browser_items[start_idx:end_idx]
         
-        # Debug: Print folder browser items
-        print(f"Folder browser items: {len(folder_browser_items)} total, highlighted: {folder_browser_highlighted}")
-        for i, item in enumerate(folder_browser_items):
-            print(f"  {i}: {item['name']} ({item['type']})")
-        
         for i, item in enumerate(visible_items):
             actual_idx = start_idx + i
             is_highlighted = actual_idx == folder_browser_highlighted
@@ -2292,12 +2601,7 @@ try:
                 display_name = item['name']
             
             # Truncate if too long
-            max_width = modal_width - 60
-            test_surf = font.render(display_name, True, color)
-            if test_surf.get_width() > max_width:
-                while len(display_name) > 5 and test_surf.get_width() > max_width:
-                    display_name = display_name[:-4] + "..."
-                    test_surf = font.render(display_name, True, color)
+            display_name = truncate_text(display_name, modal_width - 60)
             
             # Highlight background
             if is_highlighted:
@@ -2305,11 +2609,13 @@ try:
                 pygame.draw.rect(screen, (240, 240, 240), highlight_rect)
             
             # Draw item
-            item_surf = font.render(display_name, True, color)
+            item_surf = render_text(display_name, color)
             screen.blit(item_surf, (title_x, item_y))
 
 
     def draw_loading_message(message):
+        global last_progress_frame
+        last_progress_frame = None
         screen.fill(BACKGROUND)
         
         # Create centered layout
@@ -2333,8 +2639,7 @@ try:
         pygame.draw.rect(screen, PRIMARY, card_rect, 2, border_radius=12)
         
         # Draw title with improved typography
-        title_font = pygame.font.Font(None, int(FONT_SIZE * 1.4))
-        title_surf = title_font.render("Loading", True, TEXT_PRIMARY)
+        title_surf = render_text("Loading", TEXT_PRIMARY, int(FONT_SIZE * 1.4))
         title_x = center_x - title_surf.get_width() // 2
         title_y = card_y + 30
         screen.blit(title_surf, (title_x, title_y))
@@ -2346,7 +2651,7 @@ try:
         pygame.draw.line(screen, PRIMARY, (line_x, line_y), (line_x + line_width, line_y), 3)
         
         # Draw message with better positioning
-        message_surf = font.render(message, True, TEXT_SECONDARY)
+        message_surf = render_text(message, TEXT_SECONDARY)
         message_x = center_x - message_surf.get_width() // 2
         message_y = line_y + 25
         screen.blit(message_surf, (message_x, message_y))
@@ -2360,7 +2665,7 @@ try:
         
         inst_y = message_y + message_surf.get_height() + 25
         for instruction in instructions:
-            inst_surf = font.render(instruction, True, TEXT_DISABLED)
+            inst_surf = render_text(instruction, TEXT_DISABLED)
             inst_x = center_x - inst_surf.get_width() // 2
             screen.blit(inst_surf, (inst_x, inst_y))
             inst_y += FONT_SIZE + 8
@@ -2379,12 +2684,7 @@ try:
         center_y = screen_height // 2
         
         # Character grid layout
-        chars = [
-            ['A', 'B', 'C', 'D', 'E', 'F', 'G', 'H', 'I', 'J'],
-            ['K', 'L', 'M', 'N', 'O', 'P', 'Q', 'R', 'S', 'T'],
-            ['U', 'V', 'W', 'X', 'Y', 'Z', '0', '1', '2', '3'],
-            ['4', '5', '6', '7', '8', '9', ' ', 'DEL', 'CLEAR', 'DONE']
-        ]
+        chars = CHAR_SELECTOR_GRID
         
         # Draw title card
         title_card_height = 80
@@ -2394,14 +2694,13 @@ try:
         pygame.draw.rect(screen, PRIMARY, card_rect, 2, border_radius=8)
         
         # Draw title
-        title_font = pygame.font.Font(None, int(FONT_SIZE * 1.2))
-        title_surf = title_font.render("Search Games", True, TEXT_PRIMARY)
+        title_surf = render_text("Search Games", TEXT_PRIMARY, int(FONT_SIZE * 1.2))
         title_x = center_x - title_surf.get_width() // 2
         screen.blit(title_surf, (title_x, title_y + 10))
         
         # Draw current search query
         query_display = f"Search: {search_query}_" if len(search_query) < 30 else f"Search: {search_query[-27:]}..."
-        query_surf = font.render(query_display, True, TEXT_SECONDARY)
+        query_surf = render_text(query_display, TEXT_SECONDARY)
         query_x = center_x - query_surf.get_width() // 2
         screen.blit(query_surf, (query_x, title_y + 45))
         
@@ -2431,7 +2730,7 @@ try:
                     text_color = TEXT_PRIMARY
                 
                 # Draw character text
-                char_font = pygame.font.Font(None, FONT_SIZE - 4) if len(char) > 1 else font
+                char_font = get_font(FONT_SIZE - 4) if len(char) > 1 else font
                 char_surf = char_font.render(char, True, text_color)
                 char_x_pos = x + (cell_width - char_surf.get_width()) // 2
                 char_y_pos = y + (cell_height - char_surf.get_height()) // 2
@@ -2445,13 +2744,20 @@ try:
         
         inst_y = grid_start_y + len(chars) * cell_height + 20
         for instruction in instructions:
-            inst_surf = font.render(instruction, True, TEXT_DISABLED)
+            inst_surf = render_text(instruction, TEXT_DISABLED)
             inst_x = center_x - inst_surf.get_width() // 2
             screen.blit(inst_surf, (inst_x, inst_y))
             inst_y += FONT_SIZE + 8
         
         pygame.display.flip()
 
+    def get_display_name(game):
+        """Return a game's filename without extension, using the name precomputed by list_files"""
+        display_name = game.get('display_name')
+        if display_name is None:
+            display_name = os.path.splitext(game.get('filename', ''))[0]
+        return display_name
+
     def decode_filename(raw_filename):
         """Properly decode URL-encoded and HTML entity-encoded filenames"""
         try:
@@ -2474,12 +2780,15 @@ try:
             # If all decoding fails, return the original
             return raw_filename
 
+    # Switch title ID in brackets, like [01234567890ABCDEF] (16 hex characters)
+    SWITCH_TITLE_ID_RE = re.compile(r'\[([0-9A-Fa-f]{16})\]')
+
+    @lru_cache(maxsize=1024)
     def extract_switch_title_id(game_name):
         """Extract Nintendo Switch title ID from game name (format: [TITLEID])"""
         try:
             # Look for pattern like [01234567890ABCDEF] (16 characters)
-            import re
-            match = re.search(r'\[([0-9A-Fa-f]{16})\]', game_name)
+            match = SWITCH_TITLE_ID_RE.search(game_name)
             if match:
                 return match.group(1).upper()
             return None
@@ -2488,43 +2797,101 @@ try:
 
     # Cache for Switch API data to avoid repeated requests
     switch_api_cache = {}
+    switch_api_loading = set()  # API URLs currently being fetched in the background
+
+    def load_switch_api_data(boxart_url):
+        """Fetch the Switch boxart API data without blocking the game list"""
+        try:
+            api_response = requests.get(boxart_url, timeout=30)
+            api_response.raise_for_status()
+            boxart_api_data = api_response.json()
+            switch_api_cache[boxart_url] = boxart_api_data
+            log_debug("Loaded %d games from Switch API", len(boxart_api_data))
+        except Exception as e:
+            log_error(f"Failed to load Switch boxart API: {e}")
+            print(f"Warning: Could not load Switch boxart data: {e}")
+        finally:
+            switch_api_loading.discard(boxart_url)
+
+    def toggle_game_selection(index):
+        """Flip the download selection state of a game index"""
+        global selected_games
+        selected_games ^= {index}
+
+    # Lowercased search names kept parallel to the list last searched
+    search_name_index = []
+    search_name_source = None
+
+    def get_search_name(game):
+        """Get the lowercased name a game is matched against when searching"""
+        if isinstance(game, dict):
+            if 'name' in game:
+                # Switch API format
+                return game.get('name', '').lower()
+            elif 'filename' in game:
+                # New format with filename and href
+                return get_display_name(game).lower()
+            return str(game).lower()
+        # Regular filename
+        return os.path.splitext(str(game))[0].lower()
+
+    def get_visible_selection():
+        """Selected games as positions in the list currently shown"""
+        global filtered_positions, filtered_positions_source
+        if not (search_mode and search_query):
+            return selected_games
+        if filtered_positions_source is not filtered_game_indices:
+            filtered_positions = {index: position for position, index in enumerate(filtered_game_indices)}
+            filtered_positions_source = filtered_game_indices
+        # Walk the selection rather than the filtered list, selections are usually few
+        return {filtered_positions[index] for index in selected_games if index in filtered_positions}
 
     def filter_games_by_search(games, query):
         """Filter games list based on search query"""
+        global filtered_game_indices, last_search_games, last_search_query
+        global search_name_index, search_name_source
         if not query.strip():
+            filtered_game_indices = range(len(games))  # Identity mapping, no need to materialize it
+            last_search_games = None
             return games
         
-        query_lower = query.lower()
-        filtered = []
+        # Lowercase every name once per list instead of once per keystroke
+        if search_name_source is not games:
+            search_name_index = [get_search_name(game) for game in games]
+            search_name_source = games
+        names = search_name_index
         
-        for game in games:
-            if isinstance(game, dict):
-                if 'name' in game:
-                    # Switch API format
-                    game_name = game.get('name', '').lower()
-                elif 'filename' in game:
-                    # New format with filename and href
-                    game_name = os.path.splitext(game.get('filename', ''))[0].lower()
-                else:
-                    game_name = str(game).lower()
-            else:
-                # Regular filename
-                game_name = os.path.splitext(str(game))[0].lower()
-            
-            if query_lower in game_name:
-                filtered.append(game)
+        query_lower = query.lower()
+        # A query that extends the previous one can only narrow its matches, so rescan just those
+        if games is last_search_games and query_lower.startswith(last_search_query):
+            candidates = filtered_game_indices
+        else:
+            candidates = range(len(games))
+        filtered_game_indices = [index for index in candidates if query_lower in names[index]]
         
-        return filtered
+        last_search_games = games
+        last_search_query = query_lower
+        return [games[index] for index in filtered_game_indices]
+
+    def back_button_pressed(back_button):
+        """Drain pending events, returning True if the back button was pressed"""
+        for event in pygame.event.get():
+            if event.type == pygame.JOYBUTTONDOWN and event.button == back_button:
+                return True
+        return False
 
     def download_files(system, selected_game_indices):
+        global last_progress_frame
+        last_progress_frame = None
         try:
             sys_data = data[system]
             formats = sys_data.get('file_format', [])
+            format_suffixes = tuple(formats)  # str.endswith checks all formats in one call
             
             # Check for custom ROM folder setting
             system_name = sys_data['name']
-            system_settings = settings.get("system_settings", {})
-            custom_folder = system_settings.get(system_name, {}).get('custom_folder', '')
+            system_settings = settings.get("system_settings", EMPTY_MAPPING)
+            custom_folder = system_settings.get(system_name, EMPTY_MAPPING).get('custom_folder', '')
             
             if custom_folder and os.path.exists(custom_folder):
                 roms_folder = custom_folder
@@ -2533,11 +2900,16 @@ try:
             
             os.makedirs(roms_folder, exist_ok=True)
 
-            selected_files = [game_list[i] for i in selected_game_indices]
+            # Download in list order rather than the set's arbitrary iteration order
+            selected_files = [game_list[i] for i in sorted(selected_game_indices)]
             total = len(selected_files)
             cancelled = False
+            back_button = get_controller_button("back")
 
             for idx, game_item in enumerate(selected_files):
+                # Check once per file too, so a batch of files that each finish under 500ms stays cancellable
+                if not cancelled and back_button_pressed(back_button):
+                    cancelled = True
                 if cancelled:
                     break
                 log_error(f"Downloading game: {game_item}")
@@ -2561,7 +2933,7 @@ try:
                     filename = game_item
                 
                 # Calculate overall progress
-                overall_progress = int((idx / total) * 100)
+                overall_progress = idx * 100 // total
                 draw_progress_bar(f"Downloading {game_name} ({idx+1}/{total})", overall_progress)
                 
                 if 'download_url' in sys_data:
@@ -2585,29 +2957,25 @@ try:
                     file_path = os.path.join(WORK_DIR, filename)
                     with open(file_path, 'wb') as f:
                         for chunk in r.iter_content(1024):
-                            # Check for cancel button
-                            for event in pygame.event.get():
-                                if event.type == pygame.JOYBUTTONDOWN and event.button == get_controller_button("back"):
-                                    cancelled = True
-                                    break
-                            if cancelled:
-                                break
-                            
                             if chunk:
                                 f.write(chunk)
                                 downloaded += len(chunk)
                                 
-                                # Calculate speed every 500ms
+                                # Calculate speed and check for cancel every 500ms
                                 current_time = pygame.time.get_ticks()
                                 if current_time - last_update >= 500:
+                                    if back_button_pressed(back_button):
+                                        cancelled = True
+                                        break
+                                    
                                     speed = (downloaded - last_downloaded) * 2  # *2 because we update every 500ms
                                     last_downloaded = downloaded
                                     last_update = current_time
                                     
                                     # Calculate file progress
-                                    file_progress = int((downloaded / total_size) * 100) if total_size > 0 else 0
+                                    file_progress = downloaded * 100 // total_size if total_size > 0 else 0
                                     # Calculate overall progress including current file
-                                    current_progress = int(((idx + (file_progress / 100)) / total) * 100)
+                                    current_progress = (idx * 100 + file_progress) // total
                                     draw_progress_bar(f"Downloading {filename} ({idx+1}/{total})", 
                                                     current_progress, downloaded, total_size, speed)
 
@@ -2632,15 +3000,12 @@ try:
                                 
                                 # Update progress every few files or for large files
                                 if extracted_files % 10 == 0 or file_info.file_size > 1024*1024:  # Every 10 files or files > 1MB
-                                    progress = int((extracted_files / total_files) * 100)
+                                    progress = extracted_files * 100 // total_files
                                     draw_progress_bar(f"Extracting {filename}... ({extracted_files}/{total_files})", progress)
                                 
                                 # Check for cancel button
-                                for event in pygame.event.get():
-                                    if event.type == pygame.JOYBUTTONDOWN and event.button == get_controller_button("back"):
-                                        cancelled = True
-                                        break
-                                if cancelled:
+                                if back_button_pressed(back_button):
+                                    cancelled = True
                                     break
                             
                             # Show final extraction progress
@@ -2656,9 +3021,6 @@ try:
                         draw_progress_bar(f"Attempting NSZ decompression for {filename}...", 0)
                         
                         try:
-                            import subprocess
-                            import shutil
-                            
                             # Check if Nintendo Switch keys are configured and exist
                             keys_path = settings.get("switch_keys_path", "")
                             keys_available = False
@@ -2774,7 +3136,7 @@ try:
                     # Move files to ROMS
                     draw_progress_bar(f"Moving files to ROMS folder...", 0)
                     for f in os.listdir(WORK_DIR):
-                        if any(f.endswith(ext) for ext in formats):
+                        if f.endswith(format_suffixes):
                             os.rename(os.path.join(WORK_DIR, f), os.path.join(roms_folder, f))
 
                     # Clean work dir
@@ -2790,11 +3152,22 @@ try:
         except Exception as e:
             log_error(f"Error in download_files for system {system}", type(e).__name__, traceback.format_exc())
 
+    @lru_cache(maxsize=None)
+    def compile_regex(pattern):
+        """Compile a regex from the systems config once and reuse it for every listing"""
+        return re.compile(pattern)
+
     def list_files(system, page=0):
+        """Fetch and parse one page of a system's game list, called on the background workers"""
         try:
-            draw_loading_message(f"Loading games for {data[system]['name']}...")
             sys_data = data[system]
             formats = sys_data.get('file_format', [])
+            format_suffixes = tuple(ext.lower() for ext in formats)  # Lowercased once for str.endswith
+            
+            # USA filter applies while parsing, so filtered-out entries are never collected
+            usa_regex = None
+            if settings.get("usa_only", False) and sys_data.get('should_filter_usa', True):
+                usa_regex = compile_regex(sys_data.get('usa_regex', '(USA)'))
 
             # Check if this is the old JSON API format
             if 'list_url' in sys_data:
@@ -2802,58 +3175,50 @@ try:
                 list_url = sys_data['list_url']
                 array_path = sys_data.get('list_json_file_location', "files")
                 file_id = sys_data.get('list_item_id', "name")
-                r = requests.get(list_url, timeout=10)
+                r = get_listing_session().get(list_url, timeout=10)
                 response = r.json()
                 
                 if isinstance(response, dict) and "files" in response:
                     files = response[array_path]
                     if isinstance(files, list):
-                        filtered_files = [f[file_id] for f in files if any(f[file_id].lower().endswith(ext.lower()) for ext in formats)]
-                        # Apply USA filter if enabled and system supports it
-                        if settings.get("usa_only", False) and sys_data.get('should_filter_usa', True):
-                            usa_regex = sys_data.get('usa_regex', '(USA)')
-                            filtered_files = [f for f in filtered_files if re.search(usa_regex, f)]
-                        return filtered_files
+                        return [f[file_id] for f in files
+                                if f[file_id].lower().endswith(format_suffixes)
+                                and (usa_regex is None or usa_regex.search(f[file_id]))]
             
             elif 'url' in sys_data:
                 # New format - HTML directory listing
                 url = sys_data['url']
                 regex_pattern = sys_data.get('regex', '<a href="([^"]+)"[^>]*>([^<]+)</a>')
                 
-                r = requests.get(url, timeout=10)
+                r = get_listing_session().get(url, timeout=10)
                 r.raise_for_status()
                 html_content = r.text
+                del r  # Release the raw bytes before matching, only the decoded text is parsed
                 
-                # Check if this is Nintendo Switch and load boxart API data
-                boxart_api_data = {}
+                # Check if this is Nintendo Switch and load boxart API data in the background
                 if sys_data.get('name') == 'Nintendo Switch' and 'boxarts' in sys_data:
-                    try:
-                        boxart_url = sys_data['boxarts']
-                        draw_loading_message(f"Loading boxart data for {sys_data['name']}...")
-                        api_response = requests.get(boxart_url, timeout=30)
-                        api_response.raise_for_status()
-                        boxart_api_data = api_response.json()
-                        switch_api_cache[boxart_url] = boxart_api_data
-                        print(f"Loaded {len(boxart_api_data)} games from Switch API")
-                    except Exception as e:
-                        log_error(f"Failed to load Switch boxart API: {e}")
-                        print(f"Warning: Could not load Switch boxart data: {e}")
+                    boxart_url = sys_data['boxarts']
+                    if boxart_url not in switch_api_cache and boxart_url not in switch_api_loading:
+                        switch_api_loading.add(boxart_url)
+                        run_in_background(load_switch_api_data, boxart_url)
                 
                 # Extract file links using regex
                 if 'regex' in sys_data:
                     # Use the provided named capture group regex
-                    matches = re.finditer(regex_pattern, html_content)
+                    pattern = compile_regex(regex_pattern)
+                    has_href = 'href' in pattern.groupindex
+                    has_text = 'text' in pattern.groupindex
                     files = []
-                    for match in matches:
+                    for match in pattern.finditer(html_content):
                         try:
                             # Try to get the filename and href from named groups
                             href = None
                             filename = None
                             
-                            if 'href' in match.groupdict():
-                                href = match.groupdict().get('href')
-                            if 'text' in match.groupdict():
-                                filename = decode_filename(match.groupdict().get('text'))
+                            if has_href:
+                                href = match.group('href')
+                            if has_text:
+                                filename = decode_filename(match.group('text'))
                             else:
                                 # Fallback to first group
                                 filename = decode_filename(match.group(1))
@@ -2861,38 +3226,75 @@ try:
                             if href and not filename:
                                 filename = decode_filename(href)
                                                     # Filter out filenames that start with unknown/problematic characters
-                            if filename and not filename[0].isascii():
+                            if filename and ord(filename[0]) >= 128:
                                 continue
-                            # Filter by file format
-                            if any(filename.lower().endswith(ext.lower()) for ext in formats):
-                                files.append({'filename': filename, 'href': href})
+                            # Filter by file format and region
+                            if usa_regex is not None and not usa_regex.search(filename):
+                                continue
+                            if filename.lower().endswith(format_suffixes):
+                                files.append({'filename': filename, 'href': href, 'display_name': os.path.splitext(filename)[0]})
                         except:
                             continue
                 else:
                     # Simple regex for href links
-                    matches = re.findall(regex_pattern, html_content)
+                    matches = compile_regex(regex_pattern).findall(html_content)
                     files = []
                     for href, text in matches:
                         filename = decode_filename(text or href)
                         # Filter out filenames that start with unknown/problematic characters
-                        if filename and not filename[0].isascii():
+                        if filename and ord(filename[0]) >= 128:
+                            continue
+                        if usa_regex is not None and not usa_regex.search(filename):
                             continue
-                        if any(filename.lower().endswith(ext.lower()) for ext in formats):
-                            files.append({'filename': filename, 'href': href})
+                        if filename.lower().endswith(format_suffixes):
+                            files.append({'filename': filename, 'href': href, 'display_name': os.path.splitext(filename)[0]})
                     log_error(f"Files: {files}")
                 
-                # Apply USA filter if enabled and system supports it
-                if settings.get("usa_only", False) and sys_data.get('should_filter_usa', True):
-                    usa_regex = sys_data.get('usa_regex', '(USA)')
-                    files = [f for f in files if re.search(usa_regex, f['filename'])]
-                
-                return sorted(files, key=lambda x: x['filename'])
+                return sorted(files, key=itemgetter('filename'))
             
             return []
         except Exception as e:
             log_error(f"Failed to fetch list for system {system}", type(e).__name__, traceback.format_exc())
             return []
 
+    def fetch_game_list(system, page, request_id, keep_current):
+        """Fetch a game list page on a background worker and hand it to the main loop"""
+        game_list_results.put((request_id, page, keep_current, list_files(system, page)))
+
+    def load_game_list_async(system, page=0, keep_current=False):
+        """Start fetching a game list page without blocking the main loop
+        
+        With keep_current the shown page stays up and is only replaced if the new page has games.
+        """
+        global game_list, game_list_loading, game_list_request
+        game_list_request += 1
+        if not keep_current:
+            game_list = []
+        game_list_loading = True
+        run_in_background(fetch_game_list, system, page, game_list_request, keep_current)
+
+    def apply_game_list_results():
+        """Apply finished game list fetches on the main thread, returns True if anything changed"""
+        global game_list, game_list_loading, current_page, last_page, highlighted, selected_games
+        changed = False
+        while True:
+            try:
+                request_id, page, keep_current, games = game_list_results.get_nowait()
+            except Empty:
+                return changed
+            if request_id != game_list_request:
+                continue  # Superseded by a later fetch
+            game_list_loading = False
+            changed = True
+            if keep_current:
+                if not games:
+                    last_page = current_page  # Nothing past this page, stop asking
+                    continue
+                highlighted = 0
+                selected_games = set()
+            game_list = games
+            current_page = page
+
     def load_folder_contents(path):
         """Load folder contents for browser"""
         global folder_browser_items, folder_browser_highlighted, folder_browser_scroll_offset
@@ -2912,21 +3314,20 @@ try:
             # Get directory contents
             if os.path.exists(path) and os.path.isdir(path):
                 try:
-                    entries = os.listdir(path)
-                    entries.sort()
+                    # scandir reports entry types from the directory read itself, without a stat call per entry
+                    with os.scandir(path) as scanned:
+                        entries = sorted(scanned, key=lambda entry: entry.name)
                     
                     # Add directories first
                     for entry in entries:
-                        entry_path = os.path.join(path, entry)
-                        if os.path.isdir(entry_path) and not entry.startswith('.'):
-                            items.append({"name": entry, "type": "folder", "path": entry_path})
+                        if entry.is_dir() and not entry.name.startswith('.'):
+                            items.append({"name": entry.name, "type": "folder", "path": entry.path})
                     
                     # Add .keys files if we're selecting Nintendo Switch keys
                     if selected_system_to_add and selected_system_to_add.get("type") == "switch_keys":
                         for entry in entries:
-                            entry_path = os.path.join(path, entry)
-                            if os.path.isfile(entry_path) and entry.lower().endswith('.keys'):
-                                items.append({"name": entry, "type": "keys_file", "path": entry_path})
+                            if entry.name.lower().endswith('.keys') and entry.is_file():
+                                items.append({"name": entry.name, "type": "keys_file", "path": entry.path})
                     
                 except PermissionError:
                     items.append({"name": "Permission denied", "type": "error", "path": path})
@@ -2943,9 +3344,12 @@ try:
             folder_browser_highlighted = 0
             folder_browser_scroll_offset = 0
 
+    # Directory listing entries that are navigation links rather than systems
+    NON_SYSTEM_LISTING_NAMES = frozenset({'..', '.', 'Parent Directory'})
+
     def load_available_systems():
         """Load available systems from list_systems entries"""
-        global available_systems, add_systems_highlighted
+        global available_systems, add_systems_highlighted, available_systems_loading
         
         try:
             # Find entries with list_systems: true
@@ -2965,21 +3369,22 @@ try:
                 return
             
             # Fetch the HTML content
-            response = requests.get(url, timeout=10)
+            response = get_listing_session().get(url, timeout=10)
             response.raise_for_status()
             html_content = response.text
             
             # Extract systems using regex
             systems = []
-            matches = re.finditer(regex_pattern, html_content)
+            pattern = compile_regex(regex_pattern)
+            group_names = pattern.groupindex
             
-            for match in matches:
+            for match in pattern.finditer(html_content):
                 try:
                     # Extract href, title, and other data from named groups
-                    href = match.group('href') if 'href' in match.groupdict() else ''
-                    title = match.group('title') if 'title' in match.groupdict() else ''
-                    text = match.group('text') if 'text' in match.groupdict() else ''
-                    size = match.group('size') if 'size' in match.groupdict() else ''
+                    href = match.group('href') if 'href' in group_names else ''
+                    title = match.group('title') if 'title' in group_names else ''
+                    text = match.group('text') if 'text' in group_names else ''
+                    size = match.group('size') if 'size' in group_names else ''
                     
                     # Use title as name, fallback to text
                     name = title if title else text
@@ -2988,7 +3393,7 @@ try:
                         name = name.strip().rstrip('/')
                         
                         # Skip if name is empty after cleaning or is navigation element
-                        if not name or name in ['..', '.', 'Parent Directory']:
+                        if not name or name in NON_SYSTEM_LISTING_NAMES:
                             continue
                         
                         # Construct full URL
@@ -3009,6 +3414,17 @@ try:
         except Exception as e:
             log_error("Failed to load available systems", type(e).__name__, traceback.format_exc())
             available_systems = []
+        finally:
+            available_systems_loading = False
+
+    def start_loading_available_systems():
+        """Fetch available systems in the background unless they are loaded or already being fetched"""
+        global available_systems_loading
+        # A failed fetch leaves the list empty, so reopening the screen retries it
+        if available_systems_loading or available_systems:
+            return
+        available_systems_loading = True
+        run_in_background(load_available_systems)
 
     def load_added_systems():
         """Load added systems from added_systems.json file"""
@@ -3027,11 +3443,7 @@ try:
     def save_added_systems(added_systems_list):
         """Save added systems to added_systems.json file"""
         try:
-            # Create directory if it doesn't exist
-            os.makedirs(os.path.dirname(ADDED_SYSTEMS_FILE), exist_ok=True)
-            
-            with open(ADDED_SYSTEMS_FILE, 'w') as f:
-                json.dump(added_systems_list, f, indent=2)
+            write_json_file(ADDED_SYSTEMS_FILE, added_systems_list)
         except Exception as e:
             log_error("Failed to save added systems", type(e).__name__, traceback.format_exc())
 
@@ -3091,12 +3503,13 @@ try:
         except Exception as e:
             log_error("Failed to fix added systems roms_folder", type(e).__name__, traceback.format_exc())
 
-    def load_main_systems_data():
+    def load_main_systems_data(main_data=None):
         """Load main systems data including added systems"""
         try:
-            # Load main systems
-            with open(JSON_FILE) as f:
-                main_data = json.load(f)
+            # Load main systems unless the caller already parsed them
+            if main_data is None:
+                with open(JSON_FILE) as f:
+                    main_data = json.load(f)
             
             # Load added systems
             added_systems = load_added_systems()
@@ -3120,54 +3533,46 @@ try:
             log_error("Failed to load main systems data", type(e).__name__, traceback.format_exc())
             return []
 
+    # First letters of the list last searched by find_next_letter_index, kept parallel to it
+    letter_index_initials = []
+    letter_index_source = None
+
+    def get_item_initial(item):
+        """Get the uppercase first letter of an item's display name, or '' if it has none"""
+        if isinstance(item, dict):
+            if 'name' in item:
+                item_name = item.get('name', '')
+            elif 'filename' in item:
+                item_name = get_display_name(item)
+            else:
+                item_name = str(item)
+        else:
+            item_name = str(item)
+        return item_name[0].upper() if item_name else ''
+
     def find_next_letter_index(items, current_index, direction):
         """Find the next item that starts with a different letter"""
+        global letter_index_initials, letter_index_source
         if not items:
             return current_index
         
-        # Get display name for current item
-        current_item = items[current_index]
-        if isinstance(current_item, dict):
-            if 'name' in current_item:
-                current_name = current_item.get('name', '')
-            elif 'filename' in current_item:
-                current_name = os.path.splitext(current_item.get('filename', ''))[0]
-            else:
-                current_name = str(current_item)
-        else:
-            current_name = str(current_item)
+        # Rebuild the initials only when the list changed, repeated jumps just scan letters
+        if letter_index_source is not items or len(letter_index_initials) != len(items):
+            letter_index_initials = [get_item_initial(item) for item in items]
+            letter_index_source = items
+        initials = letter_index_initials
         
-        if not current_name:
+        current_letter = initials[current_index]
+        if not current_letter:
             return current_index
         
-        current_letter = current_name[0].upper()
         if direction > 0:  # Moving right/forward
-            for i in range(current_index + 1, len(items)):
-                item = items[i]
-                if isinstance(item, dict):
-                    if 'name' in item:
-                        item_name = item.get('name', '')
-                    elif 'filename' in item:
-                        item_name = os.path.splitext(item.get('filename', ''))[0]
-                    else:
-                        item_name = str(item)
-                else:
-                    item_name = str(item)
-                if item_name and item_name[0].upper() > current_letter:
+            for i in range(current_index + 1, len(initials)):
+                if initials[i] and initials[i] > current_letter:
                     return i
         else:  # Moving left/backward
             for i in range(current_index - 1, -1, -1):
-                item = items[i]
-                if isinstance(item, dict):
-                    if 'name' in item:
-                        item_name = item.get('name', '')
-                    elif 'filename' in item:
-                        item_name = os.path.splitext(item.get('filename', ''))[0]
-                    else:
-                        item_name = str(item)
-                else:
-                    item_name = str(item)
-                if item_name and item_name[0].upper() < current_letter:
+                if initials[i] and initials[i] < current_letter:
                     return i
         return current_index
 
@@ -3181,8 +3586,8 @@ try:
     mapping_exists = load_controller_mapping()
     
     # Debug: Print loaded mapping
-    print(f"DEBUG: Controller mapping loaded: {controller_mapping}")
-    print(f"DEBUG: Mapping exists: {mapping_exists}, Needs mapping: {needs_controller_mapping()}")
+    log_debug("DEBUG: Controller mapping loaded: %s", controller_mapping)
+    log_debug("DEBUG: Mapping exists: %s, Needs mapping: %s", mapping_exists, needs_controller_mapping())
     
     # If no controller mapping exists or is incomplete, collect it on first run
     if not mapping_exists or needs_controller_mapping():
@@ -3196,7 +3601,8 @@ try:
     try:
         # Fix any issues with existing added systems
         fix_added_systems_roms_folder()
-        data = load_main_systems_data()
+        # Reuse the systems list parsed at startup instead of reading the file again
+        data = load_main_systems_data(data)
     except Exception as e:
         log_error("Failed to load main systems data", type(e).__name__, traceback.format_exc())
         # Keep original data if loading fails
@@ -3228,30 +3634,35 @@ try:
         """Get the button number for a specific action based on dynamic controller mapping"""
         if action in controller_mapping:
             button_info = controller_mapping[action]
-            print(f"get_controller_button({action}) - button_info: {button_info}")
+            log_debug("get_controller_button(%s) - button_info: %s", action, button_info)
             return button_info
         else:
-            print(f"get_controller_button({action}) - not found in mapping")
+            log_debug("get_controller_button(%s) - not found in mapping", action)
             return None
     
+    # Fallback to keyboard key names when no controller mapping exists
+    KEYBOARD_BUTTON_NAMES = {
+        "select": "A (X)",
+        "back": "B (T)",
+        "up": "Up arrow",
+        "down": "Down arrow",
+        "left": "Left arrow",
+        "right": "Right arrow",
+        "start": "Start",
+        "search": "Select"
+    }
+
     def get_button_name(action):
         """Get the display name for a button action based on dynamic controller mapping"""
-        # Fallback to keyboard key names when no controller mapping exists
-        keyboard_names = {
-            "select": "A (X)",
-            "back": "B (T)", 
-            "up": "Up arrow",
-            "down": "Down arrow",
-            "left": "Left arrow", 
-            "right": "Right arrow",
-            "start": "Start",
-            "search": "Select"
-        }
-        return keyboard_names.get(action.lower(), action.upper())
+        return KEYBOARD_BUTTON_NAMES.get(action.lower(), action.upper())
         
 
     def input_matches_action(event, action):
         """Check if the pygame event matches the mapped action"""
+        # Only controller events can match a mapping, skip the lookup for anything else
+        if event.type != pygame.JOYBUTTONDOWN and event.type != pygame.JOYHATMOTION:
+            return False
+        
         button_info = get_controller_button(action)
         if button_info is None:
             return False
@@ -3260,11 +3671,9 @@ try:
             # Check regular button press
             return isinstance(button_info, int) and event.button == button_info
         elif event.type == pygame.JOYHATMOTION:
-            # Check D-pad/hat input (handle both tuples and lists from JSON)
-            if ((isinstance(button_info, tuple) or isinstance(button_info, list)) and 
-                len(button_info) >= 3 and button_info[0] == "hat"):
-                _, expected_x, expected_y = button_info[0:3]
-                return event.value == (expected_x, expected_y)
+            # Check D-pad/hat input (hat entries are normalized to tuples on load)
+            if isinstance(button_info, tuple) and len(button_info) >= 3 and button_info[0] == "hat":
+                return event.value == button_info[1:3]
         
         return False
 
@@ -3280,6 +3689,7 @@ try:
     folder_browser_items = []
     folder_browser_highlighted = 0
     folder_browser_scroll_offset = 0
+    ENTERABLE_FOLDER_TYPES = frozenset({"folder", "parent"})
     
     # System name input modal state
     show_system_input = False
@@ -3296,6 +3706,10 @@ try:
     running = True
     button_delay = 0
     last_dpad_state = (0, 0)  # Track last D-pad state to detect actual changes
+    previous_mode = mode  # Mode drawn on the previous frame
+    needs_redraw = True  # Set by input, navigation and arrived images
+    last_redraw_time = 0
+    IDLE_REDRAW_INTERVAL_MS = 250  # Picks up background changes and keeps cursors blinking
     last_dpad_time = 0  # Track when last D-pad navigation occurred
     DPAD_DEBOUNCE_MS = 100  # Minimum time between D-pad navigation actions
 
@@ -3305,10 +3719,7 @@ try:
         screen_width, screen_height = screen.get_size()
         
         # Semi-transparent background overlay
-        overlay = pygame.Surface((screen_width, screen_height))
-        overlay.set_alpha(128)
-        overlay.fill(BLACK)
-        screen.blit(overlay, (0, 0))
+        screen.blit(get_overlay((screen_width, screen_height), BLACK, 128), (0, 0))
         
         # Modal sizing
         modal_width = min(int(screen_width * 0.8), 500)
@@ -3321,7 +3732,7 @@ try:
         pygame.draw.rect(screen, BLACK, modal_rect, 3)
         
         # Title
-        title_surf = font.render("Enter Folder Name", True, TEXT_PRIMARY)
+        title_surf = render_text("Enter Folder Name", TEXT_PRIMARY)
         title_x = modal_x + 20
         title_y = modal_y + 20
         screen.blit(title_surf, (title_x, title_y))
@@ -3329,16 +3740,16 @@ try:
         # Current folder name display
         name_y = title_y + 50
         name_text = folder_name_input_text if folder_name_input_text else "Enter folder name..."
-        name_surf = font.render(name_text, True, TEXT_PRIMARY)
+        name_surf = render_text(name_text, TEXT_PRIMARY)
         screen.blit(name_surf, (title_x, name_y))
         
         # Character selection area
         char_y = name_y + 60
-        char_title_surf = font.render("Select Character:", True, TEXT_PRIMARY)
+        char_title_surf = render_text("Select Character:", TEXT_PRIMARY)
         screen.blit(char_title_surf, (title_x, char_y))
         
         # Character grid (A-Z, 0-9)
-        chars = list("abcdefghijklmnopqrstuvwxyz0123456789")
+        chars = FOLDER_NAME_CHARS
         chars_per_row = 13
         char_size = 30
         char_spacing = 5
@@ -3347,8 +3758,7 @@ try:
         char_start_y = char_y + 40
         
         for i, char in enumerate(chars):
-            row = i // chars_per_row
-            col = i % chars_per_row
+            row, col = divmod(i, chars_per_row)
             
             char_x = char_start_x + col * (char_size + char_spacing)
             char_y_pos = char_start_y + row * (char_size + char_spacing)
@@ -3362,7 +3772,7 @@ try:
             pygame.draw.rect(screen, WHITE, char_rect)
             pygame.draw.rect(screen, BLACK, char_rect, 1)
             
-            char_surf = font.render(char, True, TEXT_PRIMARY)
+            char_surf = render_text(char, TEXT_PRIMARY)
             char_text_x = char_x + (char_size - char_surf.get_width()) // 2
             char_text_y = char_y_pos + (char_size - char_surf.get_height()) // 2
             screen.blit(char_surf, (char_text_x, char_text_y))
@@ -3378,7 +3788,7 @@ try:
         
         inst_y = char_start_y + 120
         for instruction in instructions:
-            inst_surf = font.render(instruction, True, TEXT_DISABLED)
+            inst_surf = render_text(instruction, TEXT_DISABLED)
             screen.blit(inst_surf, (title_x, inst_y))
             inst_y += 20
 
@@ -3396,6 +3806,7 @@ try:
         """Restart the application"""
         try:
             print("Restarting application...")
+            flush_settings_save()
             pygame.quit()
             # Use os.execv to restart the script
             os.execv(sys.executable, ['python'] + sys.argv)
@@ -3441,16 +3852,78 @@ try:
             log_error(f"Failed to create folder in {folder_browser_current_path}", type(e).__name__, traceback.format_exc())
             show_folder_name_input = False
 
+    # Short labels and font scales for the special on-screen keyboard keys
+    SEARCH_KEY_LABELS = {
+        "DEL": ("DEL", 0.7),
+        "CLEAR": ("CLR", 0.7),
+        "DONE": ("OK", 0.8),
+        " ": ("SPC", 0.7),
+    }
+
+    @lru_cache(maxsize=None)
+    def render_search_key(char, text_color):
+        """Return the rendered label for an on-screen keyboard key"""
+        if char in SEARCH_KEY_LABELS:
+            char_display, scale = SEARCH_KEY_LABELS[char]
+            char_font = get_font(int(FONT_SIZE * scale))
+        else:
+            char_display = char.upper()
+            char_font = font
+        return char_font.render(char_display, True, text_color)
+
+    # On-screen search keyboard layout
+    SEARCH_KEYS_PER_ROW = 13
+    SEARCH_KEY_SIZE = 32
+    SEARCH_KEY_SPACING = 6
+
+    def draw_search_key(target, char, char_x, char_y_pos, is_selected):
+        """Draw one on-screen keyboard key at the given position"""
+        char_size = SEARCH_KEY_SIZE
+        
+        # Button background with different states
+        char_rect = pygame.Rect(char_x, char_y_pos, char_size, char_size)
+        
+        if is_selected:
+            # Selected state with glow effect
+            glow_rect = pygame.Rect(char_x - 2, char_y_pos - 2, char_size + 4, char_size + 4)
+            pygame.draw.rect(target, PRIMARY_LIGHT, glow_rect, border_radius=8)
+            pygame.draw.rect(target, PRIMARY, char_rect, border_radius=6)
+            text_color = BACKGROUND
+        elif char in SPECIAL_KEYBOARD_KEYS:
+            # Special buttons (DEL, CLEAR, DONE, SPACE) with accent color
+            pygame.draw.rect(target, SURFACE_HOVER, char_rect, border_radius=6)
+            pygame.draw.rect(target, SECONDARY, char_rect, 2, border_radius=6)
+            text_color = TEXT_PRIMARY
+        else:
+            # Regular buttons
+            pygame.draw.rect(target, SURFACE_HOVER, char_rect, border_radius=6)
+            pygame.draw.rect(target, TEXT_DISABLED, char_rect, 1, border_radius=6)
+            text_color = TEXT_PRIMARY
+        
+        # Enhanced character display
+        char_surf = render_search_key(char, text_color)
+        char_text_x = char_x + (char_size - char_surf.get_width()) // 2
+        char_text_y = char_y_pos + (char_size - char_surf.get_height()) // 2
+        target.blit(char_surf, (char_text_x, char_text_y))
+
+    @lru_cache(maxsize=1)
+    def get_search_keyboard_surface():
+        """Render every search key in its idle state onto one transparent surface"""
+        step = SEARCH_KEY_SIZE + SEARCH_KEY_SPACING
+        rows = -(-len(SEARCH_CHARS) // SEARCH_KEYS_PER_ROW)
+        surface = pygame.Surface((SEARCH_KEYS_PER_ROW * step, rows * step), pygame.SRCALPHA)
+        for i, char in enumerate(SEARCH_CHARS):
+            row, col = divmod(i, SEARCH_KEYS_PER_ROW)
+            draw_search_key(surface, char, col * step, row * step, False)
+        return surface
+
     def draw_search_input_modal():
         """Draw the search input modal overlay with modern styling"""
         # Get actual screen dimensions
         screen_width, screen_height = screen.get_size()
         
         # Enhanced semi-transparent background overlay with blur effect
-        overlay = pygame.Surface((screen_width, screen_height))
-        overlay.set_alpha(180)  # More opaque for better contrast
-        overlay.fill(BACKGROUND)
-        screen.blit(overlay, (0, 0))
+        screen.blit(get_overlay((screen_width, screen_height), BACKGROUND, 180), (0, 0))  # More opaque for better contrast
         
         # Responsive modal sizing with better proportions
         modal_width = min(max(int(screen_width * 0.85), 400), 700)
@@ -3467,8 +3940,7 @@ try:
         pygame.draw.rect(screen, PRIMARY, modal_rect, 3, border_radius=BORDER_RADIUS)
         
         # Enhanced title with styling
-        title_font = pygame.font.Font(None, int(FONT_SIZE * 1.3))
-        title_surf = title_font.render("Search Games", True, TEXT_PRIMARY)
+        title_surf = render_text("Search Games", TEXT_PRIMARY, int(FONT_SIZE * 1.3))
         title_x = modal_x + 25
         title_y = modal_y + 25
         screen.blit(title_surf, (title_x, title_y))
@@ -3492,7 +3964,7 @@ try:
         search_text_y = search_y + (search_input_height - FONT_SIZE) // 2
         
         if search_input_text:
-            search_surf = font.render(search_input_text, True, TEXT_PRIMARY)
+            search_surf = render_text(search_input_text, TEXT_PRIMARY)
             screen.blit(search_surf, (search_text_x, search_text_y))
             
             # Draw blinking cursor
@@ -3503,75 +3975,30 @@ try:
                 pygame.draw.rect(screen, PRIMARY, cursor_rect)
         else:
             # Placeholder text
-            placeholder_surf = font.render("Enter search term...", True, TEXT_DISABLED)
+            placeholder_surf = render_text("Enter search term...", TEXT_DISABLED)
             screen.blit(placeholder_surf, (search_text_x, search_text_y))
         
         # Character selection area with modern styling
         char_section_y = search_y + search_input_height + 25
-        char_title_surf = font.render("Select Character:", True, TEXT_SECONDARY)
+        char_title_surf = render_text("Select Character:", TEXT_SECONDARY)
         screen.blit(char_title_surf, (title_x, char_section_y))
         
         # Enhanced character grid with modern button styling
-        chars = list("abcdefghijklmnopqrstuvwxyz0123456789") + [" ", "DEL", "CLEAR", "DONE"]
-        chars_per_row = 13
-        char_size = 32
-        char_spacing = 6
+        chars = SEARCH_CHARS
+        chars_per_row = SEARCH_KEYS_PER_ROW
+        char_size = SEARCH_KEY_SIZE
+        char_spacing = SEARCH_KEY_SPACING
         
         char_start_x = title_x
         char_start_y = char_section_y + 35
         
-        for i, char in enumerate(chars):
-            row = i // chars_per_row
-            col = i % chars_per_row
-            
-            char_x = char_start_x + col * (char_size + char_spacing)
-            char_y_pos = char_start_y + row * (char_size + char_spacing)
-            
-            # Modern button styling
-            is_selected = i == search_cursor_position
-            is_special = char in ["DEL", "CLEAR", "DONE", " "]
-            
-            # Button background with different states
-            char_rect = pygame.Rect(char_x, char_y_pos, char_size, char_size)
-            
-            if is_selected:
-                # Selected state with glow effect
-                glow_rect = pygame.Rect(char_x - 2, char_y_pos - 2, char_size + 4, char_size + 4)
-                pygame.draw.rect(screen, PRIMARY_LIGHT, glow_rect, border_radius=8)
-                pygame.draw.rect(screen, PRIMARY, char_rect, border_radius=6)
-                text_color = BACKGROUND
-            elif is_special:
-                # Special buttons (DEL, CLEAR, DONE, SPACE) with accent color
-                pygame.draw.rect(screen, SURFACE_HOVER, char_rect, border_radius=6)
-                pygame.draw.rect(screen, SECONDARY, char_rect, 2, border_radius=6)
-                text_color = TEXT_PRIMARY
-            else:
-                # Regular buttons
-                pygame.draw.rect(screen, SURFACE_HOVER, char_rect, border_radius=6)
-                pygame.draw.rect(screen, TEXT_DISABLED, char_rect, 1, border_radius=6)
-                text_color = TEXT_PRIMARY
-            
-            # Enhanced character display
-            if char == "DEL":
-                char_display = "DEL"
-                char_font = pygame.font.Font(None, int(FONT_SIZE * 0.7))
-            elif char == "CLEAR":
-                char_display = "CLR"
-                char_font = pygame.font.Font(None, int(FONT_SIZE * 0.7))
-            elif char == "DONE":
-                char_display = "OK"
-                char_font = pygame.font.Font(None, int(FONT_SIZE * 0.8))
-            elif char == " ":
-                char_display = "SPC"
-                char_font = pygame.font.Font(None, int(FONT_SIZE * 0.7))
-            else:
-                char_display = char.upper()
-                char_font = font
-            
-            char_surf = char_font.render(char_display, True, text_color)
-            char_text_x = char_x + (char_size - char_surf.get_width()) // 2
-            char_text_y = char_y_pos + (char_size - char_surf.get_height()) // 2
-            screen.blit(char_surf, (char_text_x, char_text_y))
+        # All keys in their idle state come from one cached surface, only the highlighted key is drawn on top
+        screen.blit(get_search_keyboard_surface(), (char_start_x, char_start_y))
+        if search_cursor_position < len(chars):
+            row, col = divmod(search_cursor_position, chars_per_row)
+            draw_search_key(screen, chars[search_cursor_position],
+                            char_start_x + col * (char_size + char_spacing),
+                            char_start_y + row * (char_size + char_spacing), True)
         
         # Enhanced instructions with modern layout
         instructions_y = char_start_y + (len(chars) // chars_per_row + 1) * (char_size + char_spacing) + 15
@@ -3585,13 +4012,13 @@ try:
         inst_x = title_x
         for section_title, section_instructions in instruction_sections:
             # Section title
-            section_surf = font.render(section_title, True, SECONDARY)
+            section_surf = render_text(section_title, SECONDARY)
             screen.blit(section_surf, (inst_x, instructions_y))
             
             # Section instructions
             inst_y = instructions_y + FONT_SIZE + 5
             for instruction in section_instructions:
-                inst_surf = font.render(f"• {instruction}", True, TEXT_DISABLED)
+                inst_surf = render_text(f"• {instruction}", TEXT_DISABLED)
                 screen.blit(inst_surf, (inst_x + 10, inst_y))
                 inst_y += FONT_SIZE + 3
             
@@ -3607,7 +4034,7 @@ try:
         if hat[1] != 0 and not show_game_details:  # Up or Down
             if show_search_input:
                 # Navigate character selection up/down for search
-                chars = list("abcdefghijklmnopqrstuvwxyz0123456789") + [" ", "DEL", "CLEAR", "DONE"]
+                chars = SEARCH_CHARS
                 chars_per_row = 13
                 total_chars = len(chars)
                 if input_matches_action(event, "up"):
@@ -3671,7 +4098,7 @@ try:
                 elif mode == "add_systems":
                     max_items = len(available_systems)
                 elif mode == "systems_settings":
-                    configurable_systems = [d for d in data if not d.get('list_systems', False) and d.get('name') != 'Other Systems']
+                    configurable_systems = get_configurable_systems()
                     max_items = len(configurable_systems)
                 elif mode == "system_settings":
                     max_items = 2  # Hide from menu + Custom ROM folder
@@ -3704,7 +4131,7 @@ try:
         elif hat[0] != 0 and not show_game_details:  # Left or Right
             if show_search_input:
                 # Navigate character selection left/right for search
-                chars = list("abcdefghijklmnopqrstuvwxyz0123456789") + [" ", "DEL", "CLEAR", "DONE"]
+                chars = SEARCH_CHARS
                 chars_per_row = 13
                 total_chars = len(chars)
                 if input_matches_action(event, "left"):
@@ -3749,22 +4176,32 @@ try:
                 if highlighted != old_highlighted:
                     movement_occurred = True
 
+    # Screens that are drawn by a single function with no extra arguments
+    MODE_DRAW_FUNCTIONS = {
+        "settings": draw_settings_menu,
+        "add_systems": draw_add_systems_menu,
+        "systems_settings": draw_systems_settings_menu,
+        "system_settings": draw_system_settings_menu,
+    }
+
     while running:
         try:
             clock.tick(FPS)
+            # Read the frame time once and share it with all per-frame timing checks
             current_time = pygame.time.get_ticks()
             
             # Update continuous navigation state
-            update_navigation_state()
+            update_navigation_state(current_time)
             
             # Handle continuous navigation (for held buttons/directions)
-            if not show_controller_mapping:
-                handle_continuous_navigation()
+            if not show_controller_mapping and handle_continuous_navigation(current_time):
+                needs_redraw = True
             
             # Check if we need to collect controller mapping first
             if show_controller_mapping:
                 if collect_controller_mapping():
                     show_controller_mapping = False
+                    needs_redraw = True
                     print("Controller mapping completed successfully")
                 else:
                     print("Controller mapping cancelled or failed")
@@ -3772,72 +4209,86 @@ try:
                     break
             
             # Update image cache from background threads
-            update_image_cache()
+            if update_image_cache():
+                needs_redraw = True
+            if apply_game_list_results():
+                needs_redraw = True
+            flush_settings_save(current_time)
+            
+            # Thumbnails still queued for the games list are useless once it is closed
+            if previous_mode == "games" and mode != "games":
+                cancel_pending_thumbnail_loads()
+            previous_mode = mode
                 
-            if mode == "systems":
-                # Get visible systems and add Settings/Add Systems options
-                visible_systems = get_visible_systems()
-                regular_systems = [d['name'] for d in visible_systems]
-                systems_with_options = regular_systems + ["Settings"]
-                
-                # Enhanced title with system info if a system was previously selected
-                title = "Select a System"
-                
-                draw_menu(title, systems_with_options, set())
-            elif mode == "games":
-                if show_search_input:
-                    draw_search_input_modal()
-                elif char_selector_mode:
-                    draw_character_selector()
-                elif game_list:  # Only draw if we have games
-                    # Use filtered list if in search mode
-                    current_game_list = filtered_game_list if search_mode and search_query else game_list
-                    # Get the current system name for the title
-                    system_name = data[selected_system]['name'] if selected_system < len(data) else "Unknown System"
-                    base_title = f"{system_name} Games"
-                    full_title = base_title + (f" (Search: {search_query})" if search_mode and search_query else "")
+            # Redraw only when something changed, with a slow refresh for background updates and blinking
+            if needs_redraw or current_time - last_redraw_time >= IDLE_REDRAW_INTERVAL_MS:
+                needs_redraw = False
+                last_redraw_time = current_time
+                drawn_thumbnail_keys.clear()
+                    
+                if mode == "systems":
+                    # Get visible systems and add Settings/Add Systems options
+                    visible_systems = get_visible_systems()
+                    systems_with_options = [d['name'] for d in visible_systems]
+                    systems_with_options.append("Settings")
+                    
+                    # Enhanced title with system info if a system was previously selected
+                    title = "Select a System"
+                    
+                    draw_menu(title, systems_with_options, set())
+                elif mode == "games":
+                    if show_search_input:
+                        draw_search_input_modal()
+                    elif char_selector_mode:
+                        draw_character_selector()
+                    elif game_list:  # Only draw if we have games
+                        # Use filtered list if in search mode
+                        current_game_list = filtered_game_list if search_mode and search_query else game_list
+                        # Get the current system name for the title
+                        system_name = data[selected_system]['name'] if selected_system < len(data) else "Unknown System"
+                        base_title = f"{system_name} Games"
+                        full_title = base_title + (f" (Search: {search_query})" if search_mode and search_query else "")
                     
-                    if settings["view_type"] == "grid":
-                        draw_grid_view(full_title, current_game_list, selected_games)
+                        if settings["view_type"] == "grid":
+                            draw_grid_view(full_title, current_game_list, get_visible_selection())
+                        else:
+                            draw_menu(full_title, current_game_list, get_visible_selection())
+                    elif game_list_loading:
+                        draw_loading_message(f"Loading games for {data[selected_system]['name']}...")
                     else:
-                        draw_menu(full_title, current_game_list, selected_games)
-                else:
-                    draw_loading_message("No games found for this system")
-            elif mode == "settings":
-                draw_settings_menu()
-            elif mode == "add_systems":
-                draw_add_systems_menu()
-            elif mode == "systems_settings":
-                draw_systems_settings_menu()
-            elif mode == "system_settings":
-                draw_system_settings_menu()
-            
-            # Draw modals if they should be shown
-            modal_drawn = False
-            if show_search_input:
-                draw_search_input_modal()
-                modal_drawn = True
-            elif show_folder_name_input:
-                draw_folder_name_input_modal()
-                modal_drawn = True
-            elif show_game_details and current_game_detail is not None:
-                draw_game_details_modal(current_game_detail)
-                modal_drawn = True
-            elif show_folder_browser:
-                draw_folder_browser_modal()
-                modal_drawn = True
+                        draw_loading_message("No games found for this system")
+                elif mode in MODE_DRAW_FUNCTIONS:
+                    MODE_DRAW_FUNCTIONS[mode]()
             
-            # Flip display once at the end
-            if modal_drawn or not (show_game_details or show_folder_browser or show_folder_name_input):
-                pygame.display.flip()
+                # Draw modals if they should be shown
+                modal_drawn = False
+                if show_search_input:
+                    draw_search_input_modal()
+                    modal_drawn = True
+                elif show_folder_name_input:
+                    draw_folder_name_input_modal()
+                    modal_drawn = True
+                elif show_game_details and current_game_detail is not None:
+                    draw_game_details_modal(current_game_detail)
+                    modal_drawn = True
+                elif show_folder_browser:
+                    draw_folder_browser_modal()
+                    modal_drawn = True
+            
+                # Flip display once at the end
+                if modal_drawn or not (show_game_details or show_folder_browser or show_folder_name_input):
+                    pygame.display.flip()
 
-            for event in pygame.event.get():
+            events = pygame.event.get()
+            if events:
+                needs_redraw = True
+            for event in events:
                 if event.type == pygame.QUIT:
                     running = False
                 elif event.type == pygame.KEYDOWN:
                     # Handle character selector navigation first
                     if show_search_input:
-                        chars = list("abcdefghijklmnopqrstuvwxyz0123456789") + [" ", "DEL", "CLEAR", "DONE"]
+                        chars = SEARCH_CHARS
                         chars_per_row = 13
                         total_chars = len(chars)
                         
@@ -3871,12 +4322,7 @@ try:
                                 char_x -= 1
                             continue
                         elif event.key == pygame.K_RIGHT:
-                            chars = [
-                                ['A', 'B', 'C', 'D', 'E', 'F', 'G', 'H', 'I', 'J'],
-                                ['K', 'L', 'M', 'N', 'O', 'P', 'Q', 'R', 'S', 'T'],
-                                ['U', 'V', 'W', 'X', 'Y', 'Z', '0', '1', '2', '3'],
-                                ['4', '5', '6', '7', '8', '9', ' ', 'DEL', 'CLEAR', 'DONE']
-                            ]
+                            chars = CHAR_SELECTOR_GRID
                             if char_y < len(chars) and char_x < len(chars[char_y]) - 1:
                                 char_x += 1
                             continue
@@ -3887,14 +4333,14 @@ try:
                             # Navigate into folder or go back
                             if folder_browser_items and folder_browser_highlighted < len(folder_browser_items):
                                 selected_item = folder_browser_items[folder_browser_highlighted]
-                                print(f"Selected item: {selected_item['name']} (type: {selected_item['type']})")
+                                log_debug("Selected item: %s (type: %s)", selected_item['name'], selected_item['type'])
                                 if selected_item["type"] == "create_folder":
                                     # Create new folder
-                                    print("Creating new folder...")
+                                    log_debug("Creating new folder...")
                                     create_folder_in_browser()
-                                elif selected_item["type"] in ["folder", "parent"]:
+                                elif selected_item["type"] in ENTERABLE_FOLDER_TYPES:
                                     folder_browser_current_path = selected_item["path"]
-                                    print(f"Navigating to folder: {folder_browser_current_path}")
+                                    log_debug("Navigating to folder: %s", folder_browser_current_path)
                                     load_folder_contents(folder_browser_current_path)
                         elif mode == "systems":
                             # Use helper function for consistent filtering
@@ -3910,7 +4356,8 @@ try:
                                     selected_visible_system = visible_systems[highlighted]
                                     selected_system = get_system_index_by_name(selected_visible_system['name'])
                                     current_page = 0
-                                    game_list = list_files(selected_system, current_page)
+                                    last_page = None
+                                    load_game_list_async(selected_system, current_page)
                                     selected_games = set()
                                 mode = "games"
                                 highlighted = 0
@@ -3918,36 +4365,28 @@ try:
                             # Handle game selection with search mode support
                             current_game_list = filtered_game_list if search_mode and search_query else game_list
                             if highlighted < len(current_game_list):
-                                # Get the actual game from the current list
-                                selected_game = current_game_list[highlighted]
                                 # Find the original index in game_list for selected_games tracking
                                 if search_mode and search_query:
                                     # In search mode, find original index
-                                    original_index = next((i for i, game in enumerate(game_list) if game == selected_game), None)
+                                    original_index = filtered_game_indices[highlighted] if highlighted < len(filtered_game_indices) else None
                                     if original_index is not None:
-                                        if original_index in selected_games:
-                                            selected_games.remove(original_index)
-                                        else:
-                                            selected_games.add(original_index)
+                                        toggle_game_selection(original_index)
                                 else:
                                     # Normal mode, use highlighted directly
-                                    if highlighted in selected_games:
-                                        selected_games.remove(highlighted)
-                                    else:
-                                        selected_games.add(highlighted)
+                                    toggle_game_selection(highlighted)
                         elif mode == "settings":
                             # Toggle settings or reset cache
                             if highlighted == 0:  # Enable Box-art Display
                                 settings["enable_boxart"] = not settings["enable_boxart"]
-                                save_settings(settings)
+                                request_settings_save()
                             elif highlighted == 1:  # Update from GitHub
                                 update_from_github()
                             elif highlighted == 2:  # View Type
                                 settings["view_type"] = "grid" if settings["view_type"] == "list" else "list"
-                                save_settings(settings)
+                                request_settings_save()
                             elif highlighted == 3:  # USA Games Only
                                 settings["usa_only"] = not settings["usa_only"]
-                                save_settings(settings)
+                                request_settings_save()
                             elif highlighted == 4:  # Work Directory
                                 # Open folder browser for work directory selection
                                 show_folder_browser = True
@@ -4003,7 +4442,7 @@ try:
                                 highlighted = 0
                                 add_systems_highlighted = 0
                                 # Load available systems in background
-                                load_available_systems()
+                                start_loading_available_systems()
                             elif highlighted == 9:  # Systems Settings
                                 mode = "systems_settings"
                                 systems_settings_highlighted = 0
@@ -4019,7 +4458,7 @@ try:
                                 load_folder_contents(folder_browser_current_path)
                         elif mode == "systems_settings":
                             # Handle systems settings navigation
-                            configurable_systems = [d for d in data if not d.get('list_systems', False) and d.get('name') != 'Other Systems']
+                            configurable_systems = get_configurable_systems()
                             if systems_settings_highlighted < len(configurable_systems):
                                 selected_system_for_settings = configurable_systems[systems_settings_highlighted]
                                 mode = "system_settings"
@@ -4028,15 +4467,9 @@ try:
                         elif mode == "system_settings":
                             # Handle individual system settings
                             if system_settings_highlighted == 0:  # Hide from main menu
-                                system_name = selected_system_for_settings['name']
-                                if "system_settings" not in settings:
-                                    settings["system_settings"] = {}
-                                if system_name not in settings["system_settings"]:
-                                    settings["system_settings"][system_name] = {}
-                                
-                                current_hidden = settings["system_settings"][system_name].get('hidden', False)
-                                settings["system_settings"][system_name]['hidden'] = not current_hidden
-                                save_settings(settings)
+                                system_entry = get_system_settings_entry(selected_system_for_settings['name'])
+                                system_entry['hidden'] = not system_entry.get('hidden', False)
+                                request_settings_save()
                             elif system_settings_highlighted == 1:  # Custom ROM folder
                                 # Open folder browser for custom ROM folder
                                 show_folder_browser = True
@@ -4048,23 +4481,15 @@ try:
                             # Handle game selection with search mode support
                             current_game_list = filtered_game_list if search_mode and search_query else game_list
                             if highlighted < len(current_game_list):
-                                # Get the actual game from the current list
-                                selected_game = current_game_list[highlighted]
                                 # Find the original index in game_list for selected_games tracking
                                 if search_mode and search_query:
                                     # In search mode, find original index
-                                    original_index = next((i for i, game in enumerate(game_list) if game == selected_game), None)
+                                    original_index = filtered_game_indices[highlighted] if highlighted < len(filtered_game_indices) else None
                                     if original_index is not None:
-                                        if original_index in selected_games:
-                                            selected_games.remove(original_index)
-                                        else:
-                                            selected_games.add(original_index)
+                                        toggle_game_selection(original_index)
                                 else:
                                     # Normal mode, use highlighted directly
-                                    if highlighted in selected_games:
-                                        selected_games.remove(highlighted)
-                                    else:
-                                        selected_games.add(highlighted)
+                                    toggle_game_selection(highlighted)
                     elif event.key == pygame.K_y:  # Y key = Detail view / Select folder
                         if show_folder_browser:
                             if selected_system_to_add is not None:
@@ -4085,12 +4510,7 @@ try:
                                 elif selected_system_to_add.get("type") == "custom_rom_folder":
                                     # Set custom ROM folder for the selected system
                                     system_name = selected_system_for_settings['name']
-                                    if "system_settings" not in settings:
-                                        settings["system_settings"] = {}
-                                    if system_name not in settings["system_settings"]:
-                                        settings["system_settings"][system_name] = {}
-                                    
-                                    settings["system_settings"][system_name]['custom_folder'] = folder_browser_current_path
+                                    get_system_settings_entry(system_name)['custom_folder'] = folder_browser_current_path
                                     save_settings(settings)
                                     show_folder_browser = False
                                     selected_system_to_add = None
@@ -4103,8 +4523,8 @@ try:
                                     roms_dir = settings.get("roms_dir", "/userdata/roms")
                                     
                                     # Debug: Print the paths
-                                    print(f"Selected folder path: {folder_browser_current_path}")
-                                    print(f"ROMs directory: {roms_dir}")
+                                    log_debug("Selected folder path: %s", folder_browser_current_path)
+                                    log_debug("ROMs directory: %s", roms_dir)
                                     
                                     if folder_browser_current_path.startswith(roms_dir):
                                         rom_folder = os.path.relpath(folder_browser_current_path, roms_dir)
@@ -4119,7 +4539,7 @@ try:
                                     if not rom_folder or rom_folder == ".":
                                         rom_folder = system_name.lower().replace(" ", "_").replace("-", "_")
                                     
-                                    print(f"Calculated roms_folder: {rom_folder}")
+                                    log_debug("Calculated roms_folder: %s", rom_folder)
                                     
                                     system_url = selected_system_to_add['url']
                                     
@@ -4205,7 +4625,7 @@ try:
                     elif event.key == pygame.K_RETURN:  # Enter = Select
                         if show_search_input:
                             # Handle character selection for search
-                            chars = list("abcdefghijklmnopqrstuvwxyz0123456789") + [" ", "DEL", "CLEAR", "DONE"]
+                            chars = SEARCH_CHARS
                             if search_cursor_position < len(chars):
                                 selected_char = chars[search_cursor_position]
                                 if selected_char == "DEL":
@@ -4231,12 +4651,7 @@ try:
                                     search_input_text += selected_char
                         elif char_selector_mode:
                             # Handle character selection
-                            chars = [
-                                ['A', 'B', 'C', 'D', 'E', 'F', 'G', 'H', 'I', 'J'],
-                                ['K', 'L', 'M', 'N', 'O', 'P', 'Q', 'R', 'S', 'T'],
-                                ['U', 'V', 'W', 'X', 'Y', 'Z', '0', '1', '2', '3'],
-                                ['4', '5', '6', '7', '8', '9', ' ', 'DEL', 'CLEAR', 'DONE']
-                            ]
+                            chars = CHAR_SELECTOR_GRID
                             if char_y < len(chars) and char_x < len(chars[char_y]):
                                 selected_char = chars[char_y][char_x]
                                 if selected_char == 'DEL':
@@ -4250,8 +4665,7 @@ try:
                                     # Finish search input
                                     char_selector_mode = False
                                     if search_query:
-                                        filtered_game_list = filter_games_by_search(game_list, search_query)
-                                        highlighted = 0  # Reset selection to first filtered item
+                                        highlighted = 0  # Reset selection to first filtered item (list is refreshed below)
                                     else:
                                         search_mode = False
                                         filtered_game_list = []
@@ -4264,7 +4678,7 @@ try:
                                     filtered_game_list = filter_games_by_search(game_list, search_query)
                         elif show_folder_name_input:
                             # Add selected character to folder name
-                            chars = list("abcdefghijklmnopqrstuvwxyz0123456789")
+                            chars = FOLDER_NAME_CHARS
                             if folder_name_char_index < len(chars):
                                 selected_char = chars[folder_name_char_index]
                                 folder_name_input_text += selected_char
@@ -4275,9 +4689,9 @@ try:
                                 if selected_item["type"] == "create_folder":
                                     # Create new folder
                                     create_folder_in_browser()
-                                elif selected_item["type"] in ["folder", "parent"]:
+                                elif selected_item["type"] in ENTERABLE_FOLDER_TYPES:
                                     folder_browser_current_path = selected_item["path"]
-                                    print(f"Navigating to folder: {folder_browser_current_path}")
+                                    log_debug("Navigating to folder: %s", folder_browser_current_path)
                                     load_folder_contents(folder_browser_current_path)
                                 elif selected_item["type"] == "keys_file":
                                     # Select this .keys file for Nintendo Switch
@@ -4292,7 +4706,7 @@ try:
                                 add_systems_highlighted -= 1
                         elif mode == "systems_settings":
                             # Systems settings navigation
-                            configurable_systems = [d for d in data if not d.get('list_systems', False) and d.get('name') != 'Other Systems']
+                            configurable_systems = get_configurable_systems()
                             if configurable_systems and systems_settings_highlighted > 0:
                                 systems_settings_highlighted -= 1
                         elif mode == "system_settings":
@@ -4314,7 +4728,7 @@ try:
                             elif mode == "add_systems":
                                 max_items = len(available_systems)
                             elif mode == "systems_settings":
-                                configurable_systems = [d for d in data if not d.get('list_systems', False) and d.get('name') != 'Other Systems']
+                                configurable_systems = get_configurable_systems()
                                 max_items = len(configurable_systems)
                             elif mode == "system_settings":
                                 max_items = 2  # Hide from menu + Custom ROM folder
@@ -4351,7 +4765,7 @@ try:
                                 add_systems_highlighted += 1
                         elif mode == "systems_settings":
                             # Systems settings navigation
-                            configurable_systems = [d for d in data if not d.get('list_systems', False) and d.get('name') != 'Other Systems']
+                            configurable_systems = get_configurable_systems()
                             if configurable_systems and systems_settings_highlighted < len(configurable_systems) - 1:
                                 systems_settings_highlighted += 1
                         elif mode == "system_settings":
@@ -4374,7 +4788,7 @@ try:
                             elif mode == "add_systems":
                                 max_items = len(available_systems)
                             elif mode == "systems_settings":
-                                configurable_systems = [d for d in data if not d.get('list_systems', False) and d.get('name') != 'Other Systems']
+                                configurable_systems = get_configurable_systems()
                                 max_items = len(configurable_systems)
                             elif mode == "system_settings":
                                 max_items = 2  # Hide from menu + Custom ROM folder
@@ -4457,7 +4871,7 @@ try:
                                 add_systems_highlighted -= 1
                         elif mode == "systems_settings":
                             # Systems settings navigation
-                            configurable_systems = [d for d in data if not d.get('list_systems', False) and d.get('name') != 'Other Systems']
+                            configurable_systems = get_configurable_systems()
                             if configurable_systems and systems_settings_highlighted > 0:
                                 systems_settings_highlighted -= 1
                         elif mode == "system_settings":
@@ -4479,7 +4893,7 @@ try:
                             elif mode == "add_systems":
                                 max_items = len(available_systems)
                             elif mode == "systems_settings":
-                                configurable_systems = [d for d in data if not d.get('list_systems', False) and d.get('name') != 'Other Systems']
+                                configurable_systems = get_configurable_systems()
                                 max_items = len(configurable_systems)
                             elif mode == "system_settings":
                                 max_items = 2  # Hide from menu + Custom ROM folder
@@ -4520,7 +4934,7 @@ try:
                                 add_systems_highlighted += 1
                         elif mode == "systems_settings":
                             # Systems settings navigation
-                            configurable_systems = [d for d in data if not d.get('list_systems', False) and d.get('name') != 'Other Systems']
+                            configurable_systems = get_configurable_systems()
                             if configurable_systems and systems_settings_highlighted < len(configurable_systems) - 1:
                                 systems_settings_highlighted += 1
                         elif mode == "system_settings":
@@ -4543,7 +4957,7 @@ try:
                             elif mode == "add_systems":
                                 max_items = len(available_systems)
                             elif mode == "systems_settings":
-                                configurable_systems = [d for d in data if not d.get('list_systems', False) and d.get('name') != 'Other Systems']
+                                configurable_systems = get_configurable_systems()
                                 max_items = len(configurable_systems)
                             elif mode == "system_settings":
                                 max_items = 2  # Hide from menu + Custom ROM folder
@@ -4599,7 +5013,7 @@ try:
                                 highlighted = find_next_letter_index(current_game_list, highlighted, 1)
                 elif event.type == pygame.JOYBUTTONDOWN:
                     # Debug: Show all button presses
-                    print(f"Joystick button pressed: {event.button}")
+                    log_debug("Joystick button pressed: %s", event.button)
                     
                     # Handle directional button inputs mapped as D-pad
                     hat = None
@@ -4757,7 +5171,7 @@ try:
                     if input_matches_action(event, "select"):  # Select
                         if show_search_input:
                             # Handle character selection for search
-                            chars = list("abcdefghijklmnopqrstuvwxyz0123456789") + [" ", "DEL", "CLEAR", "DONE"]
+                            chars = SEARCH_CHARS
                             if search_cursor_position < len(chars):
                                 selected_char = chars[search_cursor_position]
                                 if selected_char == "DEL":
@@ -4783,7 +5197,7 @@ try:
                                     search_input_text += selected_char
                         elif show_folder_name_input:
                             # Add selected character to folder name
-                            chars = list("abcdefghijklmnopqrstuvwxyz0123456789")
+                            chars = FOLDER_NAME_CHARS
                             if folder_name_char_index < len(chars):
                                 selected_char = chars[folder_name_char_index]
                                 folder_name_input_text += selected_char
@@ -4794,9 +5208,9 @@ try:
                                 if selected_item["type"] == "create_folder":
                                     # Create new folder
                                     create_folder_in_browser()
-                                elif selected_item["type"] in ["folder", "parent"]:
+                                elif selected_item["type"] in ENTERABLE_FOLDER_TYPES:
                                     folder_browser_current_path = selected_item["path"]
-                                    print(f"Navigating to folder: {folder_browser_current_path}")
+                                    log_debug("Navigating to folder: %s", folder_browser_current_path)
                                     load_folder_contents(folder_browser_current_path)
                                 elif selected_item["type"] == "keys_file":
                                     # Select this .keys file for Nintendo Switch
@@ -4819,7 +5233,8 @@ try:
                                     selected_visible_system = visible_systems[highlighted]
                                     selected_system = get_system_index_by_name(selected_visible_system['name'])
                                     current_page = 0
-                                    game_list = list_files(selected_system, current_page)
+                                    last_page = None
+                                    load_game_list_async(selected_system, current_page)
                                     selected_games = set()
                                     mode = "games"
                                     highlighted = 0
@@ -4827,36 +5242,28 @@ try:
                             # Handle game selection with search mode support
                             current_game_list = filtered_game_list if search_mode and search_query else game_list
                             if highlighted < len(current_game_list):
-                                # Get the actual game from the current list
-                                selected_game = current_game_list[highlighted]
                                 # Find the original index in game_list for selected_games tracking
                                 if search_mode and search_query:
                                     # In search mode, find original index
-                                    original_index = next((i for i, game in enumerate(game_list) if game == selected_game), None)
+                                    original_index = filtered_game_indices[highlighted] if highlighted < len(filtered_game_indices) else None
                                     if original_index is not None:
-                                        if original_index in selected_games:
-                                            selected_games.remove(original_index)
-                                        else:
-                                            selected_games.add(original_index)
+                                        toggle_game_selection(original_index)
                                 else:
                                     # Normal mode, use highlighted directly
-                                    if highlighted in selected_games:
-                                        selected_games.remove(highlighted)
-                                    else:
-                                        selected_games.add(highlighted)
+                                    toggle_game_selection(highlighted)
                         elif mode == "settings":
                             # Toggle settings or reset cache
                             if highlighted == 0:  # Enable Box-art Display
                                 settings["enable_boxart"] = not settings["enable_boxart"]
-                                save_settings(settings)
+                                request_settings_save()
                             elif highlighted == 1:  # Update from GitHub
                                 update_from_github()
                             elif highlighted == 2:  # View Type
                                 settings["view_type"] = "grid" if settings["view_type"] == "list" else "list"
-                                save_settings(settings)
+                                request_settings_save()
                             elif highlighted == 3:  # USA Games Only
                                 settings["usa_only"] = not settings["usa_only"]
-                                save_settings(settings)
+                                request_settings_save()
                             elif highlighted == 4:  # Work Directory
                                 # Open folder browser for work directory selection
                                 show_folder_browser = True
@@ -4912,7 +5319,7 @@ try:
                                 highlighted = 0
                                 add_systems_highlighted = 0
                                 # Load available systems in background
-                                load_available_systems()
+                                start_loading_available_systems()
                             elif highlighted == 9:  # Systems Settings
                                 mode = "systems_settings"
                                 systems_settings_highlighted = 0
@@ -4928,7 +5335,7 @@ try:
                                 load_folder_contents(folder_browser_current_path)
                         elif mode == "systems_settings":
                             # Handle systems settings navigation
-                            configurable_systems = [d for d in data if not d.get('list_systems', False) and d.get('name') != 'Other Systems']
+                            configurable_systems = get_configurable_systems()
                             if systems_settings_highlighted < len(configurable_systems):
                                 selected_system_for_settings = configurable_systems[systems_settings_highlighted]
                                 mode = "system_settings"
@@ -4937,15 +5344,9 @@ try:
                         elif mode == "system_settings":
                             # Handle individual system settings
                             if system_settings_highlighted == 0:  # Hide from main menu
-                                system_name = selected_system_for_settings['name']
-                                if "system_settings" not in settings:
-                                    settings["system_settings"] = {}
-                                if system_name not in settings["system_settings"]:
-                                    settings["system_settings"][system_name] = {}
-                                
-                                current_hidden = settings["system_settings"][system_name].get('hidden', False)
-                                settings["system_settings"][system_name]['hidden'] = not current_hidden
-                                save_settings(settings)
+                                system_entry = get_system_settings_entry(selected_system_for_settings['name'])
+                                system_entry['hidden'] = not system_entry.get('hidden', False)
+                                request_settings_save()
                             elif system_settings_highlighted == 1:  # Custom ROM folder
                                 # Open folder browser for custom ROM folder
                                 show_folder_browser = True
@@ -4957,26 +5358,18 @@ try:
                             # Handle game selection with search mode support
                             current_game_list = filtered_game_list if search_mode and search_query else game_list
                             if highlighted < len(current_game_list):
-                                # Get the actual game from the current list
-                                selected_game = current_game_list[highlighted]
                                 # Find the original index in game_list for selected_games tracking
                                 if search_mode and search_query:
                                     # In search mode, find original index
-                                    original_index = next((i for i, game in enumerate(game_list) if game == selected_game), None)
+                                    original_index = filtered_game_indices[highlighted] if highlighted < len(filtered_game_indices) else None
                                     if original_index is not None:
-                                        if original_index in selected_games:
-                                            selected_games.remove(original_index)
-                                        else:
-                                            selected_games.add(original_index)
+                                        toggle_game_selection(original_index)
                                 else:
                                     # Normal mode, use highlighted directly
-                                    if highlighted in selected_games:
-                                        selected_games.remove(highlighted)
-                                    else:
-                                        selected_games.add(highlighted)
+                                    toggle_game_selection(highlighted)
                     elif input_matches_action(event, "detail"):  # Detail view / Select folder
                         if show_folder_browser:
-                            print(f"Detail button pressed - Current folder: {folder_browser_current_path}")
+                            log_debug("Detail button pressed - Current folder: %s", folder_browser_current_path)
                             if selected_system_to_add is not None:
                                 if selected_system_to_add.get("type") == "work_dir":
                                     # Set work directory
@@ -4995,12 +5388,7 @@ try:
                                 elif selected_system_to_add.get("type") == "custom_rom_folder":
                                     # Set custom ROM folder for the selected system
                                     system_name = selected_system_for_settings['name']
-                                    if "system_settings" not in settings:
-                                        settings["system_settings"] = {}
-                                    if system_name not in settings["system_settings"]:
-                                        settings["system_settings"][system_name] = {}
-                                    
-                                    settings["system_settings"][system_name]['custom_folder'] = folder_browser_current_path
+                                    get_system_settings_entry(system_name)['custom_folder'] = folder_browser_current_path
                                     save_settings(settings)
                                     show_folder_browser = False
                                     selected_system_to_add = None
@@ -5013,8 +5401,8 @@ try:
                                     roms_dir = settings.get("roms_dir", "/userdata/roms")
                                     
                                     # Debug: Print the paths
-                                    print(f"Selected folder path: {folder_browser_current_path}")
-                                    print(f"ROMs directory: {roms_dir}")
+                                    log_debug("Selected folder path: %s", folder_browser_current_path)
+                                    log_debug("ROMs directory: %s", roms_dir)
                                     
                                     if folder_browser_current_path.startswith(roms_dir):
                                         rom_folder = os.path.relpath(folder_browser_current_path, roms_dir)
@@ -5029,7 +5417,7 @@ try:
                                     if not rom_folder or rom_folder == ".":
                                         rom_folder = system_name.lower().replace(" ", "_").replace("-", "_")
                                     
-                                    print(f"Calculated roms_folder: {rom_folder}")
+                                    log_debug("Calculated roms_folder: %s", rom_folder)
                                     
                                     system_url = selected_system_to_add['url']
                                     
@@ -5091,22 +5479,17 @@ try:
                             mode = "systems_settings"
                             highlighted = systems_settings_highlighted
                     elif input_matches_action(event, "left_shoulder"):  # Left shoulder - Previous page
-                        if mode == "games" and data[selected_system].get('supports_pagination', False):
+                        if mode == "games" and data[selected_system].get('supports_pagination', False) and not game_list_loading:
                             if current_page > 0:
                                 current_page -= 1
-                                game_list = list_files(selected_system, current_page)
+                                load_game_list_async(selected_system, current_page)
                                 highlighted = 0
                                 selected_games = set()
                     elif input_matches_action(event, "right_shoulder"):  # Right shoulder - Next page
-                        if mode == "games" and data[selected_system].get('supports_pagination', False):
-                            current_page += 1
-                            new_games = list_files(selected_system, current_page)
-                            if new_games:  # Only move if there are games on next page
-                                game_list = new_games
-                                highlighted = 0
-                                selected_games = set()
-                            else:
-                                current_page -= 1  # Revert if no games found
+                        # Skip the request once the end of the list is known
+                        if mode == "games" and data[selected_system].get('supports_pagination', False) and current_page != last_page and not game_list_loading:
+                            # Only moves if there are games on next page, see apply_game_list_results
+                            load_game_list_async(selected_system, current_page + 1, keep_current=True)
                     elif input_matches_action(event, "start"):  # Start Download
                         if show_search_input:
                             # Finish search input
@@ -5170,6 +5553,9 @@ try:
         except Exception as e:
             log_error("Error in main loop", type(e).__name__, traceback.format_exc())
 
+    # Write settings toggled just before quitting
+    flush_settings_save()
+
 except Exception as e:
     log_error("Fatal error during initialization", type(e).__name__, traceback.format_exc())
 finally: